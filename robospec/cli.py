@@ -1,23 +1,30 @@
 """RoboSpec CLI — Natural Language to Isaac Lab Environments."""
 
 import asyncio
+import os
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache, partial
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
 import typer
 from rich.console import Console
-from rich.panel import Panel
-from rich.progress import Progress, SpinnerColumn, TextColumn
 
-from robospec.nemotron.client import NemotronClient
-from robospec.pipeline.analyzer import analyze_task, RobotType
-from robospec.pipeline.context import build_context
-from robospec.pipeline.generator import generate_config, repair_config, _build_config, _make_task_name, _make_task_id
-from robospec.pipeline.validator import validate_config, load_api_whitelist, auto_correct_code
-from robospec.pipeline.explainer import explain_config
+# The pipeline (httpx, jinja2, dotenv) and the rich progress/panel widgets
+# are imported inside the functions that use them so that `--help` and
+# argument errors do not pay for them.
+if TYPE_CHECKING:
+    from rich.progress import Progress
+
+    from robospec.pipeline.generator import GeneratedConfig
 
 MAX_REPAIR_ATTEMPTS = 2
 
+# With ROBOSPEC_RACE_REPAIRS=1 the repair attempts run concurrently, one per
+# temperature, and the first candidate that validates wins
+REPAIR_RACE_TEMPERATURES = (0.1, 0.4)
+
 app = typer.Typer(
     name="robospec",
     help="Natural language to Isaac Lab RL environments.",
@@ -31,7 +38,9 @@ def callback() -> None:
     """RoboSpec — Natural Language to Isaac Lab Environments."""
 
 
-def _make_progress() -> Progress:
+def _make_progress() -> "Progress":
+    from rich.progress import Progress, SpinnerColumn, TextColumn
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[progress.description]{task.description}"),
@@ -40,13 +49,110 @@ def _make_progress() -> Progress:
     )
 
 
+@contextmanager
+def _stage(progress: "Progress", description: str) -> Iterator[None]:
+    """Show a spinner line on the shared progress display while a stage runs."""
+    task_id = progress.add_task(description, total=None)
+    try:
+        yield
+    finally:
+        progress.remove_task(task_id)
+
+
+@lru_cache(maxsize=1)
+def _full_whitelist_hint() -> str:
+    """The sorted whitelist hint. The whitelist never changes within a run."""
+    from robospec.pipeline.validator import load_api_whitelist
+
+    return "AVAILABLE MDP FUNCTIONS (use ONLY these):\n" + ", ".join(sorted(load_api_whitelist()))
+
+
 def _build_whitelist_hint(errors: list[str]) -> str:
     """If errors include unknown API symbols, build a hint with the full whitelist."""
     has_api_errors = any("Unknown MDP function" in e for e in errors)
     if not has_api_errors:
         return ""
-    whitelist = load_api_whitelist()
-    return "AVAILABLE MDP FUNCTIONS (use ONLY these):\n" + ", ".join(sorted(whitelist))
+    return _full_whitelist_hint()
+
+
+def _write_utf8(path: Path, text: str) -> None:
+    # Encode explicitly: write_text() would use the locale's encoding
+    path.write_bytes(text.encode("utf-8"))
+
+
+async def _write_config_files(out_dir: Path, config: "GeneratedConfig") -> list[str]:
+    """Write the env_cfg, __init__.py and train.py files concurrently.
+
+    Returns the names written.
+    """
+    files = {f"{config.task_name}_env_cfg.py": config.env_cfg}
+    if config.init_py:
+        files["__init__.py"] = config.init_py
+    if config.train_script:
+        files["train.py"] = config.train_script
+
+    loop = asyncio.get_running_loop()
+    await loop.run_in_executor(None, partial(out_dir.mkdir, parents=True, exist_ok=True))
+    await asyncio.gather(*(
+        loop.run_in_executor(None, _write_utf8, out_dir / name, text)
+        for name, text in files.items()
+    ))
+    return list(files)
+
+
+async def _gather_or_cancel(*aws):
+    """asyncio.gather() that cancels and awaits the siblings when one fails.
+
+    A bare gather leaves the others running, so a failed file write would let
+    the caller close the HTTP client under an in-flight request.
+    """
+    tasks = [asyncio.ensure_future(aw) for aw in aws]
+    try:
+        return await asyncio.gather(*tasks)
+    except BaseException:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        raise
+
+
+async def _race_repairs(client, code: str, errors: list[str], context: str, whitelist_hint: str):
+    """Run one repair per REPAIR_RACE_TEMPERATURES entry concurrently.
+
+    Returns (code, corrections, result) for the first candidate that
+    validates, cancelling the rest, or for the last one to finish if none do.
+    A candidate whose request fails is skipped; its error is raised only if
+    every candidate failed.
+    """
+    from robospec.pipeline.generator import repair_config
+    from robospec.pipeline.validator import correct_and_validate
+
+    pending = {
+        asyncio.create_task(
+            repair_config(client, code, errors, context, whitelist_hint, temperature=t)
+        )
+        for t in REPAIR_RACE_TEMPERATURES
+    }
+    outcome = None
+    last_error: Exception | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                try:
+                    repaired = task.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                outcome = correct_and_validate(repaired)
+                if outcome[2].is_valid:
+                    return outcome
+    finally:
+        for task in pending:
+            task.cancel()
+    if outcome is None:
+        raise last_error
+    return outcome
 
 
 async def _run_pipeline(
@@ -55,128 +161,145 @@ async def _run_pipeline(
     robot: Optional[str],
     verbose: bool,
 ) -> None:
+    from rich.panel import Panel
+
+    from robospec.nemotron.client import NemotronClient
+    from robospec.pipeline.analyzer import analyze_task, RobotType
+    from robospec.pipeline.context import build_context, estimate_tokens
+    from robospec.pipeline.generator import generate_config, repair_config, _build_config
+    from robospec.pipeline.validator import correct_and_validate, load_api_whitelist
+    from robospec.pipeline.explainer import explain_config
+
     client = NemotronClient()
 
     try:
-        # 1. Analyze
         with _make_progress() as progress:
-            progress.add_task("Analyzing task...", total=None)
-            task_spec = await analyze_task(client, description)
+            # 1. Analyze
+            with _stage(progress, "Analyzing task..."):
+                task_spec = await analyze_task(client, description)
 
-        # Override robot if specified
-        if robot:
-            task_spec.robot = RobotType(robot)
+            # Override robot if specified
+            if robot:
+                task_spec.robot = RobotType(robot)
 
-        console.print(
-            f"  Detected: [bold cyan]{task_spec.category.value}[/] "
-            f"with [bold green]{task_spec.robot.value}[/]"
-        )
-        console.print(f"  Objectives: {', '.join(task_spec.objectives)}")
-        if task_spec.constraints:
-            console.print(f"  Constraints: {', '.join(task_spec.constraints)}")
+            # 2. Build context — pure file I/O, so run it in a worker thread while
+            # the analysis summary is printed
+            loop = asyncio.get_running_loop()
+            context_future = loop.run_in_executor(None, build_context, task_spec)
 
-        # 2. Build context
-        with _make_progress() as progress:
-            progress.add_task("Building context from Isaac Lab reference...", total=None)
-            context = build_context(task_spec)
+            console.print(
+                f"  Detected: [bold cyan]{task_spec.category.value}[/] "
+                f"with [bold green]{task_spec.robot.value}[/]"
+            )
+            console.print(f"  Objectives: {', '.join(task_spec.objectives)}")
+            if task_spec.constraints:
+                console.print(f"  Constraints: {', '.join(task_spec.constraints)}")
 
-        context_tokens = len(context) // 4  # rough estimate
-        console.print(f"  Context: ~{context_tokens:,} tokens of Isaac Lab reference")
+            with _stage(progress, "Building context from Isaac Lab reference..."):
+                context = await context_future
+                context_tokens = await loop.run_in_executor(None, estimate_tokens, context)
 
-        # 3. Generate
-        with _make_progress() as progress:
-            progress.add_task("Generating Isaac Lab configuration...", total=None)
-            config = await generate_config(client, task_spec, context)
+            console.print(f"  Context: ~{context_tokens:,} tokens of Isaac Lab reference")
 
-        if verbose:
-            console.print("\n[dim]--- Raw Nemotron Response ---[/dim]")
-            console.print(config.raw_response[:2000])
-            console.print("[dim]--- End Response ---[/dim]\n")
+            # 3. Generate — load the validator's API whitelist in the background
+            # while the model is busy
+            whitelist_future = loop.run_in_executor(None, load_api_whitelist)
+            with _stage(progress, "Generating Isaac Lab configuration..."):
+                config = await generate_config(client, task_spec, context)
 
-        # 4. Auto-correct + Validate + Repair loop
-        task_name = _make_task_name(task_spec)
-        task_id = _make_task_id(task_spec)
+            if verbose:
+                console.print("\n[dim]--- Raw Nemotron Response ---[/dim]")
+                console.print(config.raw_response[:2000])
+                console.print("[dim]--- End Response ---[/dim]\n")
 
-        # Auto-correct common hallucinations before validation
-        best_code, corrections = auto_correct_code(config.env_cfg)
-        if corrections:
-            for c in corrections:
-                console.print(f"  [cyan]Auto-corrected: {c}[/]")
+            # 4. Auto-correct + Validate + Repair loop
+            await whitelist_future
 
-        with _make_progress() as progress:
-            progress.add_task("Validating generated code...", total=None)
-            result = validate_config(best_code)
-
-        if result.warnings:
-            for w in result.warnings:
-                console.print(f"  [yellow]Warning: {w}[/]")
-        for attempt in range(MAX_REPAIR_ATTEMPTS):
-            if result.is_valid:
-                break
-
-            for e in result.errors:
-                console.print(f"  [red]Error: {e}[/]")
-            console.print(f"  [yellow]Repair attempt {attempt + 1}/{MAX_REPAIR_ATTEMPTS}...[/]")
-
-            whitelist_hint = _build_whitelist_hint(result.errors)
-
-            with _make_progress() as progress:
-                progress.add_task("Repairing configuration...", total=None)
-                repaired_code = await repair_config(
-                    client, best_code, result.errors, context, whitelist_hint
-                )
+            # Auto-correct common hallucinations before validation
+            with _stage(progress, "Validating generated code..."):
+                best_code, corrections, result = correct_and_validate(config.env_cfg)
 
-            best_code, repair_corrections = auto_correct_code(repaired_code)
-            if repair_corrections:
-                for c in repair_corrections:
+            if corrections:
+                for c in corrections:
                     console.print(f"  [cyan]Auto-corrected: {c}[/]")
 
-            with _make_progress() as progress:
-                progress.add_task("Re-validating...", total=None)
-                result = validate_config(best_code)
+            if result.warnings:
+                for w in result.warnings:
+                    console.print(f"  [yellow]Warning: {w}[/]")
 
-        if not result.is_valid:
-            for e in result.errors:
-                console.print(f"  [red]Error (final): {e}[/]")
-            console.print(
-                "[red]Validation still failing after repairs. Saving best attempt for inspection.[/]"
-            )
+            race_repairs = os.getenv("ROBOSPEC_RACE_REPAIRS") == "1"
+            if race_repairs and not result.is_valid:
+                for e in result.errors:
+                    console.print(f"  [red]Error: {e}[/]")
+                console.print(
+                    f"  [yellow]Racing {len(REPAIR_RACE_TEMPERATURES)} repair candidates...[/]"
+                )
 
-        # Rebuild config with the (possibly repaired) env_cfg
-        config = _build_config(
-            best_code, config.raw_response,
-            task_name, task_id, task_spec.num_envs, task_spec.category.value,
-        )
+                with _stage(progress, "Repairing configuration..."):
+                    best_code, repair_corrections, result = await _race_repairs(
+                        client, best_code, result.errors, context,
+                        _build_whitelist_hint(result.errors),
+                    )
 
-        # 5. Explain
-        with _make_progress() as progress:
-            progress.add_task("Generating reward explanation...", total=None)
-            config.readme = await explain_config(client, config.env_cfg, description)
+                if repair_corrections:
+                    for c in repair_corrections:
+                        console.print(f"  [cyan]Auto-corrected: {c}[/]")
 
-        # 6. Write output
-        out_dir = output or Path("output") / config.task_name
-        out_dir.mkdir(parents=True, exist_ok=True)
+            # The race already spent the repair budget
+            for attempt in range(0 if race_repairs else MAX_REPAIR_ATTEMPTS):
+                if result.is_valid:
+                    break
 
-        files_written: list[str] = []
+                for e in result.errors:
+                    console.print(f"  [red]Error: {e}[/]")
+                console.print(f"  [yellow]Repair attempt {attempt + 1}/{MAX_REPAIR_ATTEMPTS}...[/]")
 
-        env_cfg_name = f"{config.task_name}_env_cfg.py"
-        (out_dir / env_cfg_name).write_text(config.env_cfg)
-        files_written.append(env_cfg_name)
+                whitelist_hint = _build_whitelist_hint(result.errors)
 
-        if config.init_py:
-            (out_dir / "__init__.py").write_text(config.init_py)
-            files_written.append("__init__.py")
+                with _stage(progress, "Repairing configuration..."):
+                    repaired_code = await repair_config(
+                        client, best_code, result.errors, context, whitelist_hint
+                    )
 
-        if config.train_script:
-            (out_dir / "train.py").write_text(config.train_script)
-            files_written.append("train.py")
+                with _stage(progress, "Re-validating..."):
+                    best_code, repair_corrections, result = correct_and_validate(repaired_code)
 
-        (out_dir / "README.md").write_text(config.readme)
-        files_written.append("README.md")
+                if repair_corrections:
+                    for c in repair_corrections:
+                        console.print(f"  [cyan]Auto-corrected: {c}[/]")
+
+            if not result.is_valid:
+                for e in result.errors:
+                    console.print(f"  [red]Error (final): {e}[/]")
+                console.print(
+                    "[red]Validation still failing after repairs. Saving best attempt for inspection.[/]"
+                )
+
+            # Rebuild config with the repaired env_cfg. generate_config already
+            # post-processed the code, so skip the rebuild if nothing changed.
+            if best_code != config.env_cfg:
+                config = _build_config(
+                    best_code, config.raw_response,
+                    config.task_name, config.task_id,
+                    task_spec.num_envs, task_spec.category.value,
+                )
+
+            # 5. Explain + 6. Write output — the README is the only file that
+            # depends on the explanation, so write the rest while it is generated
+            out_dir = output or Path("output") / config.task_name
+
+            with _stage(progress, "Generating reward explanation..."):
+                config.readme, files_written = await _gather_or_cancel(
+                    explain_config(client, config.env_cfg, description),
+                    _write_config_files(out_dir, config),
+                )
+
+            _write_utf8(out_dir / "README.md", config.readme)
+            files_written.append("README.md")
 
         # 7. Summary
         console.print()
-        file_list = "\n".join(f"   - {f}" for f in files_written)
+        file_list = "\n".join([f"   - {f}" for f in files_written])
         console.print(
             Panel(
                 f"[bold green]Generated {len(files_written)} files in {out_dir}/[/]\n"
@@ -188,6 +311,12 @@ async def _run_pipeline(
             )
         )
 
+        if verbose:
+            stats = client.stats
+            console.print(
+                f"[dim]Cache: {stats['cache_hits']} hits, {stats['cache_misses']} misses[/dim]"
+            )
+
     finally:
         await client.close()
 
@@ -211,6 +340,8 @@ def generate(
     ),
 ) -> None:
     """Generate an Isaac Lab RL environment from a natural language description."""
+    from rich.panel import Panel
+
     console.print(
         Panel(
             "[bold]RoboSpec[/] — Natural Language to Isaac Lab Environments",
@@ -0,0 +1,92 @@
+"""On-disk cache for deterministic Nemotron completions."""
+
+import hashlib
+import json
+import os
+import time
+import warnings
+from pathlib import Path
+from typing import Optional
+
+DEFAULT_CACHE_DIR = Path.home() / ".cache" / "robospec"
+DEFAULT_TTL_S = 24 * 60 * 60
+
+
+def _env_ttl() -> float:
+    """ROBOSPEC_CACHE_TTL in seconds; a malformed value falls back to the default."""
+    raw = os.getenv("ROBOSPEC_CACHE_TTL")
+    if raw is None:
+        return DEFAULT_TTL_S
+    try:
+        return float(raw)
+    except ValueError:
+        warnings.warn(
+            f"Ignoring invalid ROBOSPEC_CACHE_TTL={raw!r}; using {DEFAULT_TTL_S}s",
+            stacklevel=3,
+        )
+        return DEFAULT_TTL_S
+
+
+class DiskCache:
+    """Store completions as JSON files keyed by a hash of the request payload.
+
+    Entries older than ``ttl_s`` (judged by file mtime) are treated as misses.
+    The directory defaults to ``~/.cache/robospec`` and the TTL to 24h; both
+    can be overridden with ``ROBOSPEC_CACHE_DIR`` and ``ROBOSPEC_CACHE_TTL``.
+    A TTL of 0 disables the cache.
+    """
+
+    def __init__(self, cache_dir: Optional[Path] = None, ttl_s: Optional[float] = None):
+        if cache_dir is None:
+            cache_dir = Path(os.getenv("ROBOSPEC_CACHE_DIR", DEFAULT_CACHE_DIR)).expanduser()
+        if ttl_s is None:
+            ttl_s = _env_ttl()
+        self.cache_dir = cache_dir
+        self.ttl_s = ttl_s
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_s > 0
+
+    @staticmethod
+    def make_key(model: str, messages: list[dict], temperature: float, max_tokens: int) -> str:
+        """Hash the request fields that determine the completion."""
+        payload = json.dumps(
+            {
+                "model": model,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+            },
+            sort_keys=True,
+        )
+        return hashlib.sha256(payload.encode()).hexdigest()
+
+    def _path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.json"
+
+    def get(self, key: str) -> Optional[str]:
+        """Return the cached completion for ``key``, or None on a miss or expiry."""
+        if not self.enabled:
+            return None
+        path = self._path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl_s:
+                return None
+            return json.loads(path.read_text())["content"]
+        except (OSError, ValueError, KeyError):
+            return None
+
+    def set(self, key: str, content: str) -> None:
+        """Store a completion. Failures to write are ignored."""
+        if not self.enabled:
+            return
+        path = self._path(key)
+        try:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write to a temp file and rename so readers never see partial JSON
+            tmp = path.with_suffix(f".{os.getpid()}.tmp")
+            tmp.write_text(json.dumps({"content": content}))
+            tmp.replace(path)
+        except OSError:
+            pass
@@ -1,15 +1,39 @@
 """Async HTTP client for Nemotron via NVIDIA NIM and OpenRouter."""
 
+import importlib.util
+import json
 import os
+from collections.abc import AsyncIterator
 
 import httpx
 from dotenv import load_dotenv
 from rich.console import Console
 
+from robospec.nemotron.cache import DiskCache
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
+
 load_dotenv()
 
 console = Console()
 
+# HTTP/2 needs the optional h2 package (pip install "httpx[http2]")
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+
+class _StreamState:
+    """Per-call flag set once a stream sends [DONE] or finish_reason "stop"."""
+
+    __slots__ = ("complete",)
+
+    def __init__(self) -> None:
+        self.complete = False
+
 
 class NemotronClient:
     """Make API calls to Nemotron. Tries NIM first, falls back to OpenRouter."""
@@ -18,10 +42,35 @@ class NemotronClient:
     OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
     MODEL = "nvidia/llama-3.3-nemotron-super-49b-v1"
 
-    def __init__(self):
+    # Only near-deterministic calls are worth caching; higher temperatures are
+    # sampled on purpose and should hit the API every time.
+    MAX_CACHE_TEMPERATURE = 0.2
+
+    # generate_config and repair_config send the same system.txt + context
+    # prefix, so the provider can cache it between calls when asked to.
+    # OpenRouter forwards cache_control to providers that support it; NIM's
+    # chat API only takes plain string content, so it is never marked there.
+    PROMPT_CACHE_URLS = (OPENROUTER_URL,)
+
+    def __init__(self, cache: DiskCache | None = None):
         self.nim_key = os.getenv("NVIDIA_API_KEY")
         self.or_key = os.getenv("OPENROUTER_API_KEY")
-        self.client = httpx.AsyncClient(timeout=120.0)
+        # One pooled client is shared by every pipeline stage so the TLS
+        # handshake is paid once per host rather than once per call.
+        # Pool options go on the client rather than a custom transport, so
+        # httpx still mounts HTTPS_PROXY/ALL_PROXY transports from the env.
+        self.client = httpx.AsyncClient(
+            timeout=httpx.Timeout(120.0, connect=10.0, write=30.0, pool=5.0),
+            http2=HTTP2_AVAILABLE,
+            limits=httpx.Limits(
+                max_keepalive_connections=8,
+                max_connections=16,
+                keepalive_expiry=60.0,
+            ),
+        )
+        self.cache = cache if cache is not None else DiskCache()
+        self.prompt_cache = os.getenv("ROBOSPEC_PROMPT_CACHE") == "1"
+        self.stats = {"cache_hits": 0, "cache_misses": 0}
 
     async def generate(
         self,
@@ -30,12 +79,100 @@ class NemotronClient:
         temperature: float = 0.2,
         max_tokens: int = 8192,
     ) -> str:
-        """Generate a completion. Try NIM first, fallback to OpenRouter."""
-        messages = [
+        """Generate a completion. Try NIM first, fallback to OpenRouter.
+
+        Low-temperature calls are served from the on-disk cache when possible.
+        """
+        messages = self._build_messages(system_prompt, user_prompt)
+
+        cache_key, cached = self._cache_lookup(messages, temperature, max_tokens)
+        if cached is not None:
+            return cached
+
+        content = await self._generate_uncached(messages, temperature, max_tokens)
+        if cache_key is not None:
+            self.cache.set(cache_key, content)
+        return content
+
+    async def generate_stream(
+        self,
+        system_prompt: str,
+        user_prompt: str,
+        temperature: float = 0.2,
+        max_tokens: int = 8192,
+    ) -> AsyncIterator[str]:
+        """Stream a completion as text chunks.
+
+        Uses the same cache and NIM -> OpenRouter fallback as generate(). The
+        fallback only happens if NIM fails before sending its first chunk.
+        A stream that ends without [DONE] or a "stop" finish reason (dropped
+        connection, provider abort) is passed through but never cached.
+        """
+        messages = self._build_messages(system_prompt, user_prompt)
+
+        cache_key, cached = self._cache_lookup(messages, temperature, max_tokens)
+        if cached is not None:
+            yield cached
+            return
+
+        state = _StreamState()
+        chunks: list[str] = []
+        async for chunk in self._stream_uncached(messages, temperature, max_tokens, state):
+            chunks.append(chunk)
+            yield chunk
+
+        if cache_key is not None and state.complete:
+            self.cache.set(cache_key, "".join(chunks))
+
+    @staticmethod
+    def _build_messages(system_prompt: str, user_prompt: str) -> list[dict]:
+        return [
             {"role": "system", "content": system_prompt},
             {"role": "user", "content": user_prompt},
         ]
 
+    @staticmethod
+    def _mark_cacheable_prefix(messages: list[dict]) -> list[dict]:
+        """Return a copy of messages with the system prompt marked for caching."""
+        marked = []
+        for message in messages:
+            if message["role"] == "system":
+                message = {
+                    "role": "system",
+                    "content": [
+                        {
+                            "type": "text",
+                            "text": message["content"],
+                            "cache_control": {"type": "ephemeral"},
+                        }
+                    ],
+                }
+            marked.append(message)
+        return marked
+
+    def _cache_lookup(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[str | None, str | None]:
+        """Return (cache_key, cached_content). The key is None if uncacheable."""
+        if not self.cache.enabled or temperature > self.MAX_CACHE_TEMPERATURE:
+            return None, None
+        cache_key = DiskCache.make_key(self.MODEL, messages, temperature, max_tokens)
+        cached = self.cache.get(cache_key)
+        if cached is not None:
+            self.stats["cache_hits"] += 1
+        else:
+            self.stats["cache_misses"] += 1
+        return cache_key, cached
+
+    async def _generate_uncached(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
         if self.nim_key:
             try:
                 return await self._call(
@@ -53,29 +190,117 @@ class NemotronClient:
             "No API key set. Set NVIDIA_API_KEY or OPENROUTER_API_KEY in .env"
         )
 
-    async def _call(
+    async def _stream_uncached(
+        self,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        state: _StreamState,
+    ) -> AsyncIterator[str]:
+        if self.nim_key:
+            started = False
+            try:
+                async for chunk in self._stream_call(
+                    self.NIM_URL, self.nim_key, messages, temperature, max_tokens, state
+                ):
+                    started = True
+                    yield chunk
+                return
+            except Exception as e:
+                if started:
+                    raise
+                console.print(f"[yellow][WARN] NIM failed: {e}, trying OpenRouter...[/yellow]")
+
+        if self.or_key:
+            async for chunk in self._stream_call(
+                self.OPENROUTER_URL, self.or_key, messages, temperature, max_tokens, state
+            ):
+                yield chunk
+            return
+
+        raise RuntimeError(
+            "No API key set. Set NVIDIA_API_KEY or OPENROUTER_API_KEY in .env"
+        )
+
+    def _request_kwargs(
         self,
         url: str,
         key: str,
         messages: list[dict],
         temperature: float,
         max_tokens: int,
-    ) -> str:
-        resp = await self.client.post(
-            url,
-            headers={
+        stream: bool = False,
+    ) -> dict:
+        if self.prompt_cache and url in self.PROMPT_CACHE_URLS:
+            messages = self._mark_cacheable_prefix(messages)
+        payload = {
+            "model": self.MODEL,
+            "messages": messages,
+            "temperature": temperature,
+            "max_tokens": max_tokens,
+        }
+        if stream:
+            payload["stream"] = True
+        return {
+            "headers": {
                 "Authorization": f"Bearer {key}",
                 "Content-Type": "application/json",
             },
-            json={
-                "model": self.MODEL,
-                "messages": messages,
-                "temperature": temperature,
-                "max_tokens": max_tokens,
-            },
+            "json": payload,
+        }
+
+    async def _call(
+        self,
+        url: str,
+        key: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+    ) -> str:
+        resp = await self.client.post(
+            url, **self._request_kwargs(url, key, messages, temperature, max_tokens)
         )
         resp.raise_for_status()
-        return resp.json()["choices"][0]["message"]["content"]
+        # Parse the raw bytes directly; only the message content is kept
+        return _json_loads(resp.content)["choices"][0]["message"]["content"]
+
+    async def _stream_call(
+        self,
+        url: str,
+        key: str,
+        messages: list[dict],
+        temperature: float,
+        max_tokens: int,
+        state: _StreamState,
+    ) -> AsyncIterator[str]:
+        """POST with stream=true and yield the content deltas of each SSE frame.
+
+        Sets state.complete when the provider signals the end of the response;
+        an in-stream error frame raises RuntimeError.
+        """
+        async with self.client.stream(
+            "POST",
+            url,
+            **self._request_kwargs(url, key, messages, temperature, max_tokens, stream=True),
+        ) as resp:
+            resp.raise_for_status()
+            async for line in resp.aiter_lines():
+                # Skip blank frame separators and ": keep-alive" comments
+                if not line.startswith("data:"):
+                    continue
+                data = line[len("data:"):].strip()
+                if data == "[DONE]":
+                    state.complete = True
+                    break
+                frame = _json_loads(data)
+                if "error" in frame:
+                    raise RuntimeError(f"Stream error from {url}: {frame['error']}")
+                choices = frame.get("choices") or [{}]
+                if choices[0].get("finish_reason") == "stop":
+                    state.complete = True
+                content = choices[0].get("delta", {}).get("content")
+                if content:
+                    yield content
 
     async def close(self):
         """Close the underlying HTTP client."""
@@ -1,13 +1,22 @@
 """Analyze natural language task descriptions into structured TaskSpec."""
 
+import asyncio
 import json
+import os
 import re
 from dataclasses import dataclass, field
 from enum import Enum
-from pathlib import Path
 from typing import Optional
 
 from robospec.nemotron.client import NemotronClient
+from robospec.pipeline.prompts import load_prompt
+
+try:
+    import orjson
+
+    _json_loads = orjson.loads
+except ImportError:  # orjson is an optional speedup
+    _json_loads = json.loads
 
 
 class TaskCategory(Enum):
@@ -23,6 +32,12 @@ class RobotType(Enum):
     ANYMAL_D = "anymal_d"
 
 
+# Value -> member maps. A plain dict lookup skips EnumType.__call__, which
+# costs several times more per member resolved
+_CATEGORY_BY_VALUE = {c.value: c for c in TaskCategory}
+_ROBOT_BY_VALUE = {r.value: r for r in RobotType}
+
+
 @dataclass
 class TaskSpec:
     category: TaskCategory
@@ -36,32 +51,33 @@ class TaskSpec:
     custom_notes: Optional[str] = None
 
 
-# Directory where prompt templates live
-PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+_FENCE_OPEN_RE = re.compile(r"^```(?:json)?\s*\n?", re.MULTILINE)
+_FENCE_CLOSE_RE = re.compile(r"\n?```\s*$", re.MULTILINE)
+_JSON_OBJECT_RE = re.compile(r"\{[\s\S]*\}")
 
 
 def _extract_json(text: str) -> dict:
     """Extract a JSON object from text that may contain surrounding prose."""
-    # Try direct parse first
+    # Try direct parse first (orjson.JSONDecodeError subclasses json's)
     text = text.strip()
     try:
-        return json.loads(text)
+        return _json_loads(text)
     except json.JSONDecodeError:
         pass
 
     # Strip markdown fences
-    text = re.sub(r"^```(?:json)?\s*\n?", "", text, flags=re.MULTILINE)
-    text = re.sub(r"\n?```\s*$", "", text, flags=re.MULTILINE)
+    text = _FENCE_OPEN_RE.sub("", text)
+    text = _FENCE_CLOSE_RE.sub("", text)
     try:
-        return json.loads(text.strip())
+        return _json_loads(text.strip())
     except json.JSONDecodeError:
         pass
 
     # Find first { ... } block
-    match = re.search(r"\{[\s\S]*\}", text)
+    match = _JSON_OBJECT_RE.search(text)
     if match:
         try:
-            return json.loads(match.group())
+            return _json_loads(match.group())
         except json.JSONDecodeError:
             pass
 
@@ -79,9 +95,17 @@ EPISODE_LENGTH_DEFAULTS: dict[str, float] = {
 MAX_EPISODE_LENGTH = 20.0
 
 
+def _enum_member(by_value: dict, enum_cls: type[Enum], value) -> Enum:
+    """Look up an enum member by value; misses raise ValueError like enum_cls(value)."""
+    try:
+        return by_value[value]
+    except (KeyError, TypeError):  # TypeError: unhashable JSON value (list, dict)
+        return enum_cls(value)
+
+
 def _parse_task_spec(data: dict, description: str) -> TaskSpec:
     """Parse a dict into a TaskSpec, handling string enum values."""
-    category = TaskCategory(data["category"])
+    category = _enum_member(_CATEGORY_BY_VALUE, TaskCategory, data["category"])
 
     # Clamp episode length to sensible defaults
     raw_length = data.get("episode_length_s", None)
@@ -93,7 +117,7 @@ def _parse_task_spec(data: dict, description: str) -> TaskSpec:
 
     return TaskSpec(
         category=category,
-        robot=RobotType(data["robot"]),
+        robot=_enum_member(_ROBOT_BY_VALUE, RobotType, data["robot"]),
         description=description,
         objectives=data.get("objectives", []),
         constraints=data.get("constraints", []),
@@ -104,15 +128,33 @@ def _parse_task_spec(data: dict, description: str) -> TaskSpec:
     )
 
 
+# Prefix for the second-chance prompt when the first response is not JSON
+JSON_RETRY_PREFIX = (
+    "Your previous response was not valid JSON. "
+    "Respond with ONLY a valid JSON object. No explanation, no markdown fences, "
+    "no text before or after. Just the JSON.\n\n"
+)
+
+
 async def analyze_task(client: NemotronClient, user_input: str) -> TaskSpec:
     """Analyze a natural language task description and return a TaskSpec.
 
     Calls Nemotron with the analyze prompt. If JSON parsing fails, retries once
     with an explicit JSON-only instruction.
+
+    With ROBOSPEC_SPECULATIVE_ANALYZE=1 both requests are sent at once and the
+    first response that parses wins, trading an extra call for one less
+    round trip when the first response is not JSON.
     """
-    system_prompt = (PROMPTS_DIR / "system.txt").read_text()
-    analyze_template = (PROMPTS_DIR / "analyze.txt").read_text()
+    system_prompt = load_prompt("system.txt")
+    analyze_template = load_prompt("analyze.txt")
     user_prompt = analyze_template.format(user_input=user_input)
+    retry_prompt = JSON_RETRY_PREFIX + user_prompt
+
+    if os.getenv("ROBOSPEC_SPECULATIVE_ANALYZE") == "1":
+        return await _analyze_speculative(
+            client, system_prompt, user_prompt, retry_prompt, user_input
+        )
 
     # First attempt
     response = await client.generate(
@@ -129,11 +171,6 @@ async def analyze_task(client: NemotronClient, user_input: str) -> TaskSpec:
         pass
 
     # Retry with stricter instruction
-    retry_prompt = (
-        "Your previous response was not valid JSON. "
-        "Respond with ONLY a valid JSON object. No explanation, no markdown fences, "
-        "no text before or after. Just the JSON.\n\n" + user_prompt
-    )
     response = await client.generate(
         system_prompt=system_prompt,
         user_prompt=retry_prompt,
@@ -143,3 +180,52 @@ async def analyze_task(client: NemotronClient, user_input: str) -> TaskSpec:
 
     data = _extract_json(response)
     return _parse_task_spec(data, user_input)
+
+
+async def _analyze_speculative(
+    client: NemotronClient,
+    system_prompt: str,
+    user_prompt: str,
+    retry_prompt: str,
+    user_input: str,
+) -> TaskSpec:
+    """Race the normal and the strict JSON-only request; cancel the loser.
+
+    A request that fails (transport error, no API key left) or returns
+    unparseable JSON does not end the race; the other one is still awaited.
+    The last error is raised only once both have failed.
+    """
+    primary = asyncio.create_task(client.generate(
+        system_prompt=system_prompt,
+        user_prompt=user_prompt,
+        temperature=0.1,
+        max_tokens=1024,
+    ))
+    strict = asyncio.create_task(client.generate(
+        system_prompt=system_prompt,
+        user_prompt=retry_prompt,
+        temperature=0.0,
+        max_tokens=1024,
+    ))
+
+    pending = {primary, strict}
+    last_error: Exception | None = None
+    try:
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            # Prefer the primary response if both finished together
+            for task in (t for t in (primary, strict) if t in done):
+                try:
+                    response = task.result()
+                except Exception as e:
+                    last_error = e
+                    continue
+                try:
+                    return _parse_task_spec(_extract_json(response), user_input)
+                except (ValueError, KeyError, json.JSONDecodeError) as e:
+                    last_error = e
+    finally:
+        for task in pending:
+            task.cancel()
+
+    raise last_error
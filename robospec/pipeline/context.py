@@ -12,6 +12,8 @@ The EXAMPLE_MAP should be expanded (not replaced) as new robot/task
 categories are added.
 """
 
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
 from robospec.pipeline.analyzer import TaskSpec
@@ -53,55 +55,157 @@ API_REFERENCE_FILES = [
 ]
 
 
-def build_context(task_spec: TaskSpec) -> str:
-    """Assemble knowledge base context for the generation prompt.
+def _read(path: Path) -> str:
+    # The knowledge files are UTF-8 with LF newlines, so skip text-mode decoding
+    return path.read_bytes().decode("utf-8")
 
-    Always includes all API reference files, robots.json, and reward_patterns.md.
-    Conditionally includes example configs based on the task category.
+
+def _read_all(paths: list[Path]) -> dict[Path, str]:
+    """Read the existing files among paths concurrently, keyed by path.
+
+    Overlaps the blocking reads so a cold page cache costs roughly the
+    slowest read rather than the sum of all of them.
     """
+    existing = [p for p in paths if p.exists()]
+    with ThreadPoolExecutor(max_workers=min(8, len(existing) or 1)) as pool:
+        return dict(zip(existing, pool.map(_read, existing)))
+
+
+def _static_paths() -> list[Path]:
+    api_dir = KNOWLEDGE_DIR / "api_reference"
+    return [
+        *(api_dir / filename for filename in API_REFERENCE_FILES),
+        KNOWLEDGE_DIR / "robots.json",
+        KNOWLEDGE_DIR / "reward_patterns.md",
+    ]
+
+
+def _example_paths(category: str) -> list[Path]:
+    examples_dir = KNOWLEDGE_DIR / "examples"
+    return [examples_dir / filename for filename in EXAMPLE_MAP.get(category, [])]
+
+
+def _knowledge_key(paths: list[Path]) -> tuple[tuple[str, int], ...]:
+    """(path, mtime_ns) of each of paths, -1 for missing ones, for cache keys."""
+    key = []
+    for p in paths:
+        try:
+            key.append((str(p), p.stat().st_mtime_ns))
+        except OSError:
+            key.append((str(p), -1))
+    return tuple(key)
+
+
+@lru_cache(maxsize=2)
+def _static_sections(static_key: tuple[tuple[str, int], ...]) -> tuple[str, ...]:
+    *api_paths, robots_path, patterns_path = _static_paths()
+    texts = _read_all([*api_paths, robots_path, patterns_path])
+
     sections: list[str] = []
 
     # 1. API Reference
     sections.append("=== ISAAC LAB API REFERENCE ===\n")
-    api_dir = KNOWLEDGE_DIR / "api_reference"
-    for filename in API_REFERENCE_FILES:
-        filepath = api_dir / filename
-        if filepath.exists():
-            sections.append(f"--- {filename} ---")
-            sections.append(filepath.read_text())
+    for filepath in api_paths:
+        if filepath in texts:
+            sections.append(f"--- {filepath.name} ---")
+            sections.append(texts[filepath])
             sections.append("")
 
     # 2. Robot Specifications
-    robots_path = KNOWLEDGE_DIR / "robots.json"
-    if robots_path.exists():
+    if robots_path in texts:
         sections.append("=== ROBOT SPECIFICATIONS ===\n")
-        sections.append(robots_path.read_text())
+        sections.append(texts[robots_path])
         sections.append("")
 
     # 3. Reward Patterns
-    patterns_path = KNOWLEDGE_DIR / "reward_patterns.md"
-    if patterns_path.exists():
+    if patterns_path in texts:
         sections.append("=== REWARD ENGINEERING PATTERNS ===\n")
-        sections.append(patterns_path.read_text())
+        sections.append(texts[patterns_path])
         sections.append("")
 
+    return tuple(sections)
+
+
+def _example_sections(category: str) -> list[str]:
+    example_paths = _example_paths(category)
+    if not example_paths:
+        return []
+
+    texts = _read_all(example_paths)
+
+    sections: list[str] = []
+
     # 4. Working Example Configurations
-    category_key = task_spec.category.value
-    example_files = EXAMPLE_MAP.get(category_key, [])
-
-    if example_files:
-        sections.append("=== WORKING EXAMPLE CONFIGURATIONS ===")
-        sections.append(
-            "Follow these patterns exactly. These are real, working Isaac Lab configs.\n"
-        )
-
-        examples_dir = KNOWLEDGE_DIR / "examples"
-        for filename in example_files:
-            filepath = examples_dir / filename
-            if filepath.exists():
-                sections.append(f"--- {filename} ---")
-                sections.append("```python")
-                sections.append(filepath.read_text())
-                sections.append("```\n")
-
-    return "\n".join(sections)
+    sections.append("=== WORKING EXAMPLE CONFIGURATIONS ===")
+    sections.append(
+        "Follow these patterns exactly. These are real, working Isaac Lab configs.\n"
+    )
+
+    for filepath in example_paths:
+        if filepath in texts:
+            sections.append(f"--- {filepath.name} ---")
+            sections.append("```python")
+            sections.append(texts[filepath])
+            sections.append("```\n")
+
+    return sections
+
+
+@lru_cache(maxsize=8)
+def _build_category_context(
+    category: str,
+    static_key: tuple[tuple[str, int], ...],
+    example_key: tuple[tuple[str, int], ...],
+) -> str:
+    # A single join over all sections, so the ~400KB result is built in one
+    # allocation rather than as static prefix + examples
+    return "\n".join((*_static_sections(static_key), *_example_sections(category)))
+
+
+def build_context(task_spec: TaskSpec) -> str:
+    """Assemble knowledge base context for the generation prompt.
+
+    Always includes all API reference files, robots.json, and reward_patterns.md.
+    Conditionally includes example configs based on the task category.
+
+    The shared static prefix comes first and the category-dependent examples
+    last; nothing from the task spec other than its category is interpolated.
+    The assembled context is cached per category, keyed on the mtimes of the
+    files it reads, so an edited knowledge file is picked up on the next call.
+    """
+    category = task_spec.category.value
+    return _build_category_context(
+        category,
+        _knowledge_key(_static_paths()),
+        _knowledge_key(_example_paths(category)),
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    """Return a tiktoken encoding, or None if tiktoken is unavailable.
+
+    get_encoding() downloads its BPE file on first use. Any failure to load
+    it (no network, proxy errors, a corrupt cache) is swallowed so callers
+    fall back to the character estimate; pre-warm the tiktoken cache (see
+    README) to keep that download off the request path. The result, None
+    included, is cached, so a failed load is not retried per call.
+    """
+    try:
+        import tiktoken
+
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception:
+        return None
+
+
+def estimate_tokens(text: str) -> int:
+    """Count prompt tokens with tiktoken if installed, else ~4 chars per token.
+
+    cl100k_base is not Nemotron's tokenizer, but it is much closer than the
+    character heuristic for the code-heavy knowledge base.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return len(text) // 4
+    return len(encoding.encode(text, disallowed_special=()))
@@ -1,10 +1,7 @@
 """Generate human-readable explanations of reward design."""
 
-from pathlib import Path
-
 from robospec.nemotron.client import NemotronClient
-
-PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+from robospec.pipeline.prompts import load_prompt
 
 
 async def explain_config(
@@ -22,8 +19,8 @@ async def explain_config(
     Returns:
         Markdown string explaining the reward design.
     """
-    system_prompt = (PROMPTS_DIR / "system.txt").read_text()
-    explain_template = (PROMPTS_DIR / "explain.txt").read_text()
+    system_prompt = load_prompt("system.txt")
+    explain_template = load_prompt("explain.txt")
 
     # Use replace instead of .format() because env_cfg contains braces
     user_prompt = explain_template.replace("{description}", description).replace(
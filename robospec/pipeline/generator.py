@@ -3,16 +3,75 @@
 import ast
 import re
 from dataclasses import dataclass, field
+from functools import lru_cache
 from pathlib import Path
 
 from jinja2 import Environment, FileSystemLoader
 
 from robospec.nemotron.client import NemotronClient
 from robospec.pipeline.analyzer import TaskSpec
+from robospec.pipeline.prompts import load_prompt
+from robospec.pipeline.validator import parse_env_cfg
 
-PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
 TEMPLATES_DIR = Path(__file__).parent.parent / "templates"
 
+# The templates ship with the package, so compile them once at import and
+# skip Jinja's per-render mtime check
+_JINJA_ENV = Environment(
+    loader=FileSystemLoader(str(TEMPLATES_DIR)),
+    keep_trailing_newline=True,
+    auto_reload=False,
+    cache_size=-1,
+)
+_INIT_TEMPLATE = _JINJA_ENV.get_template("__init__.py.j2")
+_TRAIN_TEMPLATE = _JINJA_ENV.get_template("train.py.j2")
+
+# Patterns used by post_process_env_cfg
+CORE_MDP_IMPORT = "import isaaclab.envs.mdp as mdp"
+# Task-specific mdp imports, one named alternative per form:
+#   module: "import isaaclab_tasks.manager_based.*.mdp as mdp"
+#   block:  "from isaaclab_tasks.manager_based.*.mdp import (...)" (multi-line;
+#           [^)] spans newlines and can't backtrack into a ")", so an unclosed
+#           block costs a single scan to the end of the buffer)
+#   line:   "from isaaclab_tasks.manager_based.*.mdp import X, Y"
+_TASK_MDP_IMPORT_RE = re.compile(
+    r"(?P<module>import\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+as\s+mdp)"
+    r"|(?P<block>from\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+import\s+\([^)]*\)\s*\n?)"
+    r"|(?P<line>from\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+import\s+[^\n(]+\n?)"
+)
+_TASK_MDP_FIXES = {
+    "module": "Replaced task-specific mdp import with isaaclab.envs.mdp",
+    "block": "Replaced task-specific from-import mdp block with isaaclab.envs.mdp",
+    "line": "Replaced task-specific from-import mdp line with isaaclab.envs.mdp",
+}
+# Single-line isaaclab/isaaclab_assets imports (not isaaclab_tasks, not multi-line)
+_ISAACLAB_IMPORT_LINE_RE = re.compile(
+    r"^(?:from|import)\s+isaaclab(?!_tasks)\S*[^(\n]*$", re.MULTILINE
+)
+_INLINE_ROBOT_RE = re.compile(
+    r"(    robot\s*(?::\s*ArticulationCfg\s*)?=\s*)"
+    r"(?!.*\.replace\().*$",
+    re.MULTILINE,
+)
+_PAREN_RE = re.compile(r"[()]")
+_LITERAL_NUCLEUS_RE = re.compile(r'"ISAACLAB_NUCLEUS_DIR/[^"]*"')
+
+# Opening or closing markdown code fence, stripped in a single pass
+_FENCE_RE = re.compile(r"^```(?:python|bash|sh)?\s*\n?|\n?```\s*$", re.MULTILINE)
+_MODULE_NAME_INVALID_RE = re.compile(r"[^a-z0-9_]")
+# One-pass ASCII sanitizer: hyphens/spaces become underscores and every other
+# character outside [a-z0-9_] is deleted
+_MODULE_NAME_TABLE = str.maketrans(
+    {
+        c: ("_" if c in "- " else None)
+        for c in map(chr, range(128))
+        if not (c.isdigit() or "a" <= c <= "z" or c == "_")
+    }
+)
+# "### FILE: name" marker; group 1 is the filename, which runs to the end of
+# the line or to the next marker
+_FILE_MARKER_RE = re.compile(r"###\s*FILE:\s*([^\n]*?)(?:\n|\Z|(?=###\s*FILE:))")
+
 # Map task categories to RoboSpec task ID naming (RoboSpec- prefix avoids
 # collisions with built-in Isaac- tasks)
 TASK_ID_MAP: dict[str, str] = {
@@ -39,7 +98,7 @@ TRAIN_FRAMEWORK_MAP: dict[str, str] = {
 
 # Per-category training configuration. Agent config paths are verified against
 # real Isaac Lab source (isaaclab_tasks/manager_based/*/agents/).
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CategoryTrainConfig:
     framework: str
     default_max_iterations: int
@@ -156,7 +215,7 @@ CATEGORY_APPROVED_FUNCTIONS: dict[str, dict[str, list[str]]] = {
 
 # Per-category robot config: the correct import line and robot assignment.
 # Verified against real Isaac Lab example configs in knowledge/examples/.
-@dataclass
+@dataclass(frozen=True, slots=True)
 class RobotConfig:
     import_line: str    # e.g. "from isaaclab_assets.robots.cartpole import CARTPOLE_CFG"
     cfg_name: str       # e.g. "CARTPOLE_CFG"
@@ -200,101 +259,79 @@ def post_process_env_cfg(code: str, category: str) -> tuple[str, list[str]]:
     result = code
 
     # 1. Fix mdp imports: replace task-specific with core
-    # Pattern A: "import isaaclab_tasks.manager_based.*.mdp as mdp"
-    task_mdp_pattern = re.compile(
-        r"import\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+as\s+mdp"
-    )
-    if task_mdp_pattern.search(result):
-        result = task_mdp_pattern.sub("import isaaclab.envs.mdp as mdp", result)
-        fixes.append("Replaced task-specific mdp import with isaaclab.envs.mdp")
-
-    # Pattern B: "from isaaclab_tasks.manager_based.*.mdp import (...)" (multi-line)
-    # These import classes like DifferentialInverseKinematicsActionCfg, UniformPoseCommandCfg, mdp
-    # which are all available via isaaclab.envs.mdp — replace entire block.
-    task_mdp_from_pattern = re.compile(
-        r"from\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+import\s+\([^)]*\)\s*\n?",
-        re.DOTALL,
-    )
-    if task_mdp_from_pattern.search(result):
-        # Check if "import isaaclab.envs.mdp as mdp" already exists
-        if "import isaaclab.envs.mdp as mdp" not in result:
-            result = task_mdp_from_pattern.sub("import isaaclab.envs.mdp as mdp\n", result)
-        else:
-            result = task_mdp_from_pattern.sub("", result)
-        fixes.append("Replaced task-specific from-import mdp block with isaaclab.envs.mdp")
-
-    # Pattern C: single-line "from isaaclab_tasks.manager_based.*.mdp import X, Y"
-    task_mdp_from_single = re.compile(
-        r"from\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+import\s+[^\n(]+\n?"
-    )
-    if task_mdp_from_single.search(result):
-        if "import isaaclab.envs.mdp as mdp" not in result:
-            result = task_mdp_from_single.sub("import isaaclab.envs.mdp as mdp\n", result)
-        else:
-            result = task_mdp_from_single.sub("", result)
-        fixes.append("Replaced task-specific from-import mdp line with isaaclab.envs.mdp")
+    # All three forms need this substring; skip the regex scan without it
+    if "isaaclab_tasks.manager_based" in result:
+        matches = list(_TASK_MDP_IMPORT_RE.finditer(result))
+        kinds = {match.lastgroup for match in matches}
+        # "import ... as mdp" is swapped in place. The from-imports (classes like
+        # DifferentialInverseKinematicsActionCfg, UniformPoseCommandCfg, which
+        # are all available via isaaclab.envs.mdp) are replaced by the core
+        # import, or dropped if the code already has it or gains it above.
+        has_core = CORE_MDP_IMPORT in result or "module" in kinds
+        replacements = {
+            "module": CORE_MDP_IMPORT,
+            "block": "" if has_core else CORE_MDP_IMPORT + "\n",
+            "line": "" if has_core or "block" in kinds else CORE_MDP_IMPORT + "\n",
+        }
+        if matches:
+            result = _apply_edits(
+                result,
+                [(m.start(), m.end(), replacements[m.lastgroup]) for m in matches],
+            )
+            fixes.extend(_TASK_MDP_FIXES[kind] for kind in _TASK_MDP_FIXES if kind in kinds)
+
+    # Steps 2 and 3 record (start, end, replacement) edits against the same
+    # buffer and splice them in with one join rather than copying it per edit
+    edits: list[tuple[int, int, str]] = []
 
     # 2. Ensure robot config import exists
     robot_cfg = CATEGORY_ROBOT_CONFIG.get(category)
     if robot_cfg and robot_cfg.cfg_name not in result:
         # Find a safe injection point: after the last single-line isaaclab/isaaclab_assets
         # import (exclude isaaclab_tasks, and skip multi-line imports with open parens)
-        import_section_end = 0
-        for match in re.finditer(
-            r"^(?:from|import)\s+isaaclab(?!_tasks)\S*[^(\n]*$", result, re.MULTILINE
-        ):
-            import_section_end = match.end()
-
-        if import_section_end > 0:
-            result = (
-                result[:import_section_end]
-                + f"\n\n{robot_cfg.import_line}"
-                + result[import_section_end:]
-            )
+        import_ends = [match.end() for match in _ISAACLAB_IMPORT_LINE_RE.finditer(result)]
+        if import_ends:
+            edits.append((import_ends[-1], import_ends[-1], f"\n\n{robot_cfg.import_line}"))
             fixes.append(f"Injected robot config import: {robot_cfg.cfg_name}")
 
     # 3. Replace inline robot definitions with .replace() pattern
-    if robot_cfg:
+    if robot_cfg and "    robot" in result:
         # Match patterns like:
         #   robot: ArticulationCfg = AssetBaseCfg(...)  (multi-line)
         #   robot = ArticulationCfg(...)  (multi-line)
         #   robot: ArticulationCfg = MISSING
         # But NOT already correct patterns like CARTPOLE_CFG.replace(...)
-        inline_robot_pattern = re.compile(
-            r"(    robot\s*(?::\s*ArticulationCfg\s*)?=\s*)"
-            r"(?!.*\.replace\().*$",
-            re.MULTILINE,
-        )
-        match = inline_robot_pattern.search(result)
+        match = _INLINE_ROBOT_RE.search(result)
         if match and robot_cfg.cfg_name not in match.group(0):
             # Find the full extent of the inline definition (may span multiple lines)
             start = match.start()
             # Find the end: look for the next class attribute at the same indent level
             # or end of the class body
-            rest = result[match.end():]
             # Count parentheses to find the end of multi-line definitions
-            paren_depth = result[start:match.end()].count("(") - result[start:match.end()].count(")")
-            end = match.end()
-            for i, char in enumerate(rest):
-                if char == "(":
-                    paren_depth += 1
-                elif char == ")":
-                    paren_depth -= 1
-                if paren_depth <= 0:
-                    # Find the end of this line
-                    nl = rest.find("\n", i)
-                    end = match.end() + (nl if nl >= 0 else len(rest))
-                    break
+            line = match.group(0)
+            paren_depth = line.count("(") - line.count(")")
+            end = _find_definition_end(result, match.end(), paren_depth)
 
             indent = match.group(1).split("robot")[0]
             replacement = f"{indent}robot: ArticulationCfg = {robot_cfg.robot_line}"
-            result = result[:start] + replacement + result[end:]
+            # The last import line can sit inside the replaced span (e.g. in a
+            # multi-line string argument); inject after the last one before it
+            if edits and start <= edits[0][0] <= end:
+                earlier = [pos for pos in import_ends if pos < start]
+                if earlier:
+                    edits[0] = (earlier[-1], earlier[-1], edits[0][2])
+                else:
+                    del edits[0]
+                    fixes.remove(f"Injected robot config import: {robot_cfg.cfg_name}")
+            edits.append((start, end, replacement))
             fixes.append(f"Replaced inline robot definition with {robot_cfg.cfg_name}.replace()")
 
+    if edits:
+        result = _apply_edits(result, edits)
+
     # 4. Remove literal "ISAACLAB_NUCLEUS_DIR" string references (not variable refs)
     # These are strings like "ISAACLAB_NUCLEUS_DIR/Robots/..." that should be variable refs
-    literal_nucleus = re.compile(r'"ISAACLAB_NUCLEUS_DIR/[^"]*"')
-    if literal_nucleus.search(result):
+    if "ISAACLAB_NUCLEUS_DIR" in result and _LITERAL_NUCLEUS_RE.search(result):
         # This means there's a string literal with the path — the robot replacement
         # above should have already fixed this, but clean up any remaining ones
         fixes.append("Warning: literal ISAACLAB_NUCLEUS_DIR string found in code")
@@ -302,19 +339,58 @@ def post_process_env_cfg(code: str, category: str) -> tuple[str, list[str]]:
     return result, fixes
 
 
+def _find_definition_end(text: str, pos: int, paren_depth: int) -> int:
+    """Return the end of the line where the parentheses open before pos close.
+
+    Jumps between parentheses with a regex scan instead of stepping through
+    every character. If the parentheses never balance, pos is returned.
+    """
+    close_at = None
+    if paren_depth <= 0 and not text.startswith("(", pos):
+        close_at = pos
+    else:
+        for paren in _PAREN_RE.finditer(text, pos):
+            paren_depth += 1 if paren.group() == "(" else -1
+            if paren_depth <= 0:
+                close_at = paren.start()
+                break
+    if close_at is None:
+        return pos
+    nl = text.find("\n", close_at)
+    return nl if nl >= 0 else len(text)
+
+
+def _apply_edits(text: str, edits: list[tuple[int, int, str]]) -> str:
+    """Apply non-overlapping (start, end, replacement) edits in a single pass."""
+    parts: list[str] = []
+    cursor = 0
+    for start, end, replacement in sorted(edits):
+        if start < cursor:
+            raise ValueError(f"Overlapping edits at offset {start}")
+        parts.append(text[cursor:start])
+        parts.append(replacement)
+        cursor = end
+    parts.append(text[cursor:])
+    return "".join(parts)
+
+
+@lru_cache(maxsize=8)
 def _format_approved_functions(category: str) -> str:
-    """Format category-specific approved functions for the generation prompt."""
+    """Format category-specific approved functions for the generation prompt.
+
+    CATEGORY_APPROVED_FUNCTIONS is static, so each category is formatted once.
+    """
     funcs = CATEGORY_APPROVED_FUNCTIONS.get(category, {})
     if not funcs:
         return ""
     lines = ["APPROVED FUNCTIONS FOR THIS TASK (use ONLY these):"]
     for section, names in funcs.items():
         if names:
-            lines.append(f"  {section.title()}: {', '.join(f'mdp.{n}' for n in names)}")
+            lines.append(f"  {section.title()}: {', '.join([f'mdp.{n}' for n in names])}")
     return "\n".join(lines)
 
 
-@dataclass
+@dataclass(slots=True)
 class GeneratedConfig:
     env_cfg: str  # Main environment config Python code
     init_py: str  # Gymnasium registration with agent config entry points
@@ -333,9 +409,9 @@ def sanitize_module_name(name: str) -> str:
     - Strips any character that isn't [a-z0-9_]
     - Prepends underscore if starts with digit
     """
-    name = name.lower()
-    name = name.replace("-", "_").replace(" ", "_")
-    name = re.sub(r"[^a-z0-9_]", "", name)
+    name = name.lower().translate(_MODULE_NAME_TABLE)
+    if not name.isascii():
+        name = _MODULE_NAME_INVALID_RE.sub("", name)
     if name and name[0].isdigit():
         name = f"_{name}"
     return name
@@ -343,75 +419,61 @@ def sanitize_module_name(name: str) -> str:
 
 def _make_task_name(task_spec: TaskSpec) -> str:
     """Derive a sanitized task name from the spec."""
-    robot = task_spec.robot.value
-    category = task_spec.category.value.split("_", 1)[-1]
-    return sanitize_module_name(f"{robot}_{category}")
+    return _task_name_for(task_spec.robot.value, task_spec.category.value)
 
 
 def _make_task_id(task_spec: TaskSpec) -> str:
     """Derive the RoboSpec gymnasium task ID."""
-    pattern = TASK_ID_MAP.get(task_spec.category.value, "RoboSpec-Custom-v0")
-    robot_pretty = ROBOT_ID_MAP.get(task_spec.robot.value, "Robot")
-    return pattern.format(robot=robot_pretty)
+    return _task_id_for(task_spec.robot.value, task_spec.category.value)
+
+
+# TaskSpec is an unhashable dataclass, so the memoized helpers take the two
+# enum values the names are derived from
+@lru_cache(maxsize=64)
+def _task_name_for(robot: str, category: str) -> str:
+    return sanitize_module_name(f"{robot}_{category.split('_', 1)[-1]}")
+
+
+@lru_cache(maxsize=64)
+def _task_id_for(robot: str, category: str) -> str:
+    pattern = TASK_ID_MAP.get(category, "RoboSpec-Custom-v0")
+    return pattern.format(robot=ROBOT_ID_MAP.get(robot, "Robot"))
 
 
 def _find_env_cfg_class(code: str) -> str | None:
     """Extract the name of the main EnvCfg class from generated code."""
     try:
-        tree = ast.parse(code)
+        tree = parse_env_cfg(code)
     except SyntaxError:
         return None
-    for node in ast.walk(tree):
+    # The registered entry point is "module:ClassName", so only top-level
+    # classes qualify and there is no need to walk into class/function bodies
+    for node in tree.body:
         if isinstance(node, ast.ClassDef) and "EnvCfg" in node.name:
             return node.name
     return None
 
 
+@lru_cache(maxsize=32)
 def _generate_init_py(
     task_name: str, task_id: str, env_cfg_class: str, train_cfg: CategoryTrainConfig | None,
 ) -> str:
-    """Generate __init__.py with gym.register() and agent config entry points."""
-    cfg_module = f"{task_name}_env_cfg"
-
-    # Build kwargs dict entries
-    kwargs_lines = [
-        f'        "env_cfg_entry_point": f"{{__name__}}.{cfg_module}:{env_cfg_class}",',
-    ]
-    if train_cfg:
-        if train_cfg.rl_games_agent_cfg:
-            kwargs_lines.append(
-                f'        "rl_games_cfg_entry_point": "{train_cfg.rl_games_agent_cfg}",'
-            )
-        if train_cfg.rsl_rl_agent_cfg:
-            kwargs_lines.append(
-                f'        "rsl_rl_cfg_entry_point": "{train_cfg.rsl_rl_agent_cfg}",'
-            )
-        if train_cfg.skrl_agent_cfg:
-            kwargs_lines.append(
-                f'        "skrl_cfg_entry_point": "{train_cfg.skrl_agent_cfg}",'
-            )
-
-    kwargs_block = "\n".join(kwargs_lines)
-
-    return f'''"""Registration for {task_id}."""
-
-import gymnasium as gym
+    """Generate __init__.py with gym.register() and agent config entry points.
 
-##
-# Register Gym environments.
-##
-
-gym.register(
-    id="{task_id}",
-    entry_point="isaaclab.envs:ManagerBasedRLEnv",
-    disable_env_checker=True,
-    kwargs={{
-{kwargs_block}
-    }},
-)
-'''
+    Rendering is pure and CategoryTrainConfig is frozen, so results are
+    cached; repairs that keep the class name reuse the previous output.
+    """
+    return _INIT_TEMPLATE.render(
+        task_id=task_id,
+        env_cfg_module=f"{task_name}_env_cfg",
+        env_cfg_class=env_cfg_class,
+        rl_games_agent_cfg=train_cfg.rl_games_agent_cfg if train_cfg else "",
+        rsl_rl_agent_cfg=train_cfg.rsl_rl_agent_cfg if train_cfg else "",
+        skrl_agent_cfg=train_cfg.skrl_agent_cfg if train_cfg else "",
+    )
 
 
+@lru_cache(maxsize=32)
 def _generate_train_py(
     task_name: str,
     task_id: str,
@@ -419,13 +481,10 @@ def _generate_train_py(
     num_envs: int,
     train_cfg: CategoryTrainConfig,
 ) -> str:
-    """Generate a standalone train.py using the Jinja2 template."""
-    env = Environment(loader=FileSystemLoader(str(TEMPLATES_DIR)), keep_trailing_newline=True)
-    template = env.get_template("train.py.j2")
-
+    """Generate a standalone train.py using the Jinja2 template (cached like __init__.py)."""
     cfg_module = f"{task_name}_env_cfg"
 
-    return template.render(
+    return _TRAIN_TEMPLATE.render(
         task_id=task_id,
         default_num_envs=num_envs,
         default_max_iterations=train_cfg.default_max_iterations,
@@ -440,9 +499,7 @@ def _generate_train_py(
 
 def _strip_code_fences(code: str) -> str:
     """Remove markdown code fences from code blocks."""
-    code = re.sub(r"^```(?:python|bash|sh)?\s*\n?", "", code, flags=re.MULTILINE)
-    code = re.sub(r"\n?```\s*$", "", code, flags=re.MULTILINE)
-    return code.strip()
+    return _FENCE_RE.sub("", code).strip()
 
 
 def _parse_response(response: str, task_name: str) -> dict[str, str]:
@@ -454,20 +511,18 @@ def _parse_response(response: str, task_name: str) -> dict[str, str]:
     """
     files: dict[str, str] = {}
 
-    # Split on ### FILE: markers
-    parts = re.split(r"###\s*FILE:\s*", response)
+    # Locate the ### FILE: markers and slice each file's body straight out of
+    # the response (text before the first marker is skipped)
+    matches = list(_FILE_MARKER_RE.finditer(response))
 
-    if len(parts) <= 1:
+    if not matches:
         # No markers found — treat entire response as env_cfg
         return {f"{task_name}_env_cfg.py": _strip_code_fences(response)}
 
-    for part in parts[1:]:  # Skip text before first marker
-        lines = part.strip().split("\n", 1)
-        if not lines:
-            continue
-        filename = lines[0].strip().rstrip(":")
-        content = lines[1] if len(lines) > 1 else ""
-        files[filename] = _strip_code_fences(content)
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(response)
+        filename = match.group(1).strip().rstrip(":")
+        files[filename] = _strip_code_fences(response[match.end():end])
 
     return files
 
@@ -482,8 +537,8 @@ async def generate_config(
     Nemotron generates only the env_cfg.py. The __init__.py and train.sh
     are produced deterministically via post-processing to ensure correctness.
     """
-    system_prompt = (PROMPTS_DIR / "system.txt").read_text()
-    generate_template = (PROMPTS_DIR / "generate.txt").read_text()
+    system_prompt = load_prompt("system.txt")
+    generate_template = load_prompt("generate.txt")
 
     task_name = _make_task_name(task_spec)
     task_id = _make_task_id(task_spec)
@@ -506,12 +561,17 @@ async def generate_config(
     # Prepend context to system prompt
     full_system = system_prompt + "\n\n" + context
 
-    response = await client.generate(
+    # Stream the (long) generation so the connection never sits idle for the
+    # whole completion; the chunks are only used once complete.
+    chunks: list[str] = []
+    async for chunk in client.generate_stream(
         system_prompt=full_system,
         user_prompt=user_prompt,
         temperature=0.2,
         max_tokens=8192,
-    )
+    ):
+        chunks.append(chunk)
+    response = "".join(chunks)
 
     env_cfg_code = _extract_env_cfg(response, task_name)
     return _build_config(env_cfg_code, response, task_name, task_id, task_spec.num_envs, task_spec.category.value)
@@ -523,20 +583,19 @@ async def repair_config(
     errors: list[str],
     context: str,
     whitelist_hint: str = "",
+    temperature: float = 0.1,
 ) -> str:
     """Repair a generated env_cfg using the repair prompt.
 
     Returns the repaired env_cfg code string.
     """
-    system_prompt = (PROMPTS_DIR / "system.txt").read_text()
-    repair_template = (PROMPTS_DIR / "repair.txt").read_text()
-
-    user_prompt = repair_template.replace(
-        "{error_list}", "\n".join(f"- {e}" for e in errors)
-    ).replace(
-        "{whitelist_hint}", whitelist_hint
-    ).replace(
-        "{original_code}", original_code
+    system_prompt = load_prompt("system.txt")
+    repair_template = load_prompt("repair.txt")
+
+    user_prompt = repair_template.format(
+        error_list="\n".join([f"- {e}" for e in errors]),
+        whitelist_hint=whitelist_hint,
+        original_code=original_code,
     )
 
     full_system = system_prompt + "\n\n" + context
@@ -544,7 +603,7 @@ async def repair_config(
     response = await client.generate(
         system_prompt=full_system,
         user_prompt=user_prompt,
-        temperature=0.1,
+        temperature=temperature,
         max_tokens=8192,
     )
 
@@ -0,0 +1,13 @@
+"""Load prompt templates from robospec/prompts/."""
+
+from functools import lru_cache
+from pathlib import Path
+
+# Directory where prompt templates live
+PROMPTS_DIR = Path(__file__).parent.parent / "prompts"
+
+
+@lru_cache(maxsize=32)
+def load_prompt(name: str) -> str:
+    """Return the text of a prompt template, read from disk once per process."""
+    return (PROMPTS_DIR / name).read_text()
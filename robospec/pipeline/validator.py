@@ -3,10 +3,16 @@
 import ast
 import difflib
 import re
+from collections.abc import Iterable, Set
 from dataclasses import dataclass, field
 from functools import lru_cache
 from pathlib import Path
 
+try:
+    from rapidfuzz import fuzz, process
+except ImportError:  # rapidfuzz is an optional speedup over difflib
+    fuzz = process = None
+
 KNOWLEDGE_DIR = Path(__file__).parent.parent / "knowledge"
 
 # Functions/classes used in our example configs that come from task-specific
@@ -53,6 +59,26 @@ COMMON_CORRECTIONS: dict[str, str | None] = {
     "feet_air_time_biped_reward": "feet_air_time",
 }
 
+# All corrections as one alternation, longest names first. The \b after the
+# group stops e.g. mdp.track_lin_vel_xy from matching inside
+# mdp.track_lin_vel_xy_exp.
+_CORRECTIONS_RE = re.compile(
+    r"mdp\.("
+    + "|".join(
+        re.escape(wrong)
+        for wrong in sorted(
+            (w for w, r in COMMON_CORRECTIONS.items() if r is not None),
+            key=len,
+            reverse=True,
+        )
+    )
+    + r")\b"
+)
+
+_TASK_MDP_IMPORT_RE = re.compile(
+    r"import\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+as\s+mdp"
+)
+
 
 @dataclass
 class ValidationResult:
@@ -62,8 +88,23 @@ class ValidationResult:
     corrections: list[str] = field(default_factory=list)
 
 
-@lru_cache(maxsize=1)
-def load_api_whitelist() -> set[str]:
+# "### mdp.function_name" or "### ClassName" headers in the API reference.
+# Bytes pattern: the headers are ASCII, so the files are scanned undecoded.
+_API_HEADER_RE = re.compile(
+    rb"^###\s+(?:mdp\.(?P<function>\w+)|(?P<cls>[A-Z]\w+))", re.MULTILINE
+)
+
+
+def _api_reference_key() -> tuple[tuple[str, int], ...]:
+    """(path, mtime_ns) of every API reference file, for cache keys."""
+    api_dir = KNOWLEDGE_DIR / "api_reference"
+    try:
+        return tuple(sorted((str(p), p.stat().st_mtime_ns) for p in api_dir.glob("*.md")))
+    except OSError:
+        return ()
+
+
+def load_api_whitelist() -> frozenset[str]:
     """Load all known MDP function/class names from the API reference markdown.
 
     Scans all files in knowledge/api_reference/ for markdown headers:
@@ -73,25 +114,87 @@ def load_api_whitelist() -> set[str]:
     Also includes SUPPLEMENTAL_WHITELIST for task-specific functions used
     in our example configs but not in the core isaaclab.envs.mdp.
 
-    Returns a cached set of allowed symbol names.
+    Returns a cached, read-only set of allowed symbol names. The cache is keyed on the
+    files' mtimes, so regenerating the reference (scripts/extract_mdp_api.py)
+    is picked up without restarting the process.
     """
+    return _load_api_whitelist(_api_reference_key())
+
+
+@lru_cache(maxsize=4)
+def _load_api_whitelist(reference_key: tuple[tuple[str, int], ...]) -> frozenset[str]:
     symbols: set[str] = set()
-    api_dir = KNOWLEDGE_DIR / "api_reference"
 
-    if not api_dir.exists():
-        return symbols
+    # No reference files: return empty so validate_config skips the API check
+    if not reference_key:
+        return frozenset()
 
-    for md_file in api_dir.glob("*.md"):
-        text = md_file.read_text()
-        # Match "### mdp.function_name" pattern
-        for match in re.finditer(r"^###\s+mdp\.(\w+)", text, re.MULTILINE):
-            symbols.add(match.group(1))
-        # Match "### ClassName" pattern (for action classes etc.)
-        for match in re.finditer(r"^###\s+([A-Z]\w+)", text, re.MULTILINE):
-            symbols.add(match.group(1))
+    for path, _mtime in reference_key:
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            continue
+        # One pass picks up both mdp.function_name and ClassName (action
+        # classes etc.) headers
+        for match in _API_HEADER_RE.finditer(data):
+            symbols.add((match.group("function") or match.group("cls")).decode("ascii"))
 
     symbols.update(SUPPLEMENTAL_WHITELIST)
-    return symbols
+    return frozenset(symbols)
+
+
+@lru_cache(maxsize=4)
+def _suggestion_index(whitelist: frozenset[str]) -> dict[str, tuple[str, ...]]:
+    """Whitelist bucketed by two-character prefix.
+
+    Fuzzy matching only looks at names sharing the unknown name's prefix,
+    which cuts the candidates from the whole API to a handful. Buckets are
+    in reverse order, so rapidfuzz ties resolve like difflib.
+    """
+    ordered = sorted(whitelist, reverse=True)
+    index: dict[str, list[str]] = {}
+    for name in ordered:
+        index.setdefault(name[:2], []).append(name)
+    buckets = {prefix: tuple(names) for prefix, names in index.items()}
+    # The empty prefix holds the full whitelist for the fallback search
+    buckets[""] = tuple(ordered)
+    return buckets
+
+
+@lru_cache(maxsize=512)
+def _suggest(name: str, whitelist: frozenset[str]) -> str | None:
+    """Closest whitelist entry to an unknown mdp name, or None.
+
+    Memoized because a repair loop re-validates the same hallucinated names
+    against the same whitelist on every attempt.
+    """
+    index = _suggestion_index(whitelist)
+    bucket = index.get(name[:2], ())
+    # Most typos keep the first two characters; only fall back to the whole
+    # whitelist when the prefix bucket has nothing close enough
+    for candidates in (bucket, index[""]):
+        if not candidates:
+            continue
+        if process is not None:
+            match = process.extractOne(name, candidates, scorer=fuzz.ratio, score_cutoff=60)
+            if match:
+                return match[0]
+        else:
+            matches = difflib.get_close_matches(name, candidates, n=1, cutoff=0.6)
+            if matches:
+                return matches[0]
+    return None
+
+
+@lru_cache(maxsize=8)
+def parse_env_cfg(code: str) -> ast.Module:
+    """ast.parse() memoized on the source text.
+
+    The generator and the validator inspect the same env_cfg, so sharing the
+    tree means clean code is parsed once. Callers must not mutate the tree.
+    Raises SyntaxError like ast.parse (failures are not cached).
+    """
+    return ast.parse(code)
 
 
 def auto_correct_code(code: str) -> tuple[str, list[str]]:
@@ -103,54 +206,72 @@ def auto_correct_code(code: str) -> tuple[str, list[str]]:
     Returns (corrected_code, list_of_corrections_applied).
     This should be called BEFORE validation and the repair loop.
     """
-    corrections: list[str] = []
-    corrected = code
+    if "mdp." not in code:
+        return code, []
 
-    for wrong, right in COMMON_CORRECTIONS.items():
-        if right is None:
-            continue
-        # Use word boundary (\b) after the name to prevent substring matches
-        pattern = re.compile(rf"mdp\.{re.escape(wrong)}\b")
-        if pattern.search(corrected):
-            corrected = pattern.sub(f"mdp.{right}", corrected)
-            corrections.append(f"mdp.{wrong} -> mdp.{right}")
+    found: set[str] = set()
+
+    def _replace(match: re.Match) -> str:
+        wrong = match.group(1)
+        found.add(wrong)
+        return f"mdp.{COMMON_CORRECTIONS[wrong]}"
+
+    # No replacement is itself a correctable name, so one pass over the code
+    # gives the same result as applying the corrections one at a time
+    corrected = _CORRECTIONS_RE.sub(_replace, code)
+    corrections = [
+        f"mdp.{wrong} -> mdp.{right}"
+        for wrong, right in COMMON_CORRECTIONS.items()
+        if wrong in found
+    ]
 
     return corrected, corrections
 
 
-def check_api_symbols(code: str, whitelist: set[str]) -> list[str]:
+def check_api_symbols(code: str, whitelist: Set[str]) -> list[str]:
     """Check that all mdp.X attribute accesses use whitelisted symbols.
 
     Walks the AST looking for patterns like `mdp.something` and returns
     error messages for any `something` not in the whitelist.
     """
     try:
-        tree = ast.parse(code)
+        tree = parse_env_cfg(code)
     except SyntaxError:
         return []  # Syntax errors are caught by the main validator
 
-    unknown: list[str] = []
-    seen: set[str] = set()
+    return _check_api_symbols_tree(tree, whitelist)
+
 
+def _check_api_symbols_tree(tree: ast.AST, whitelist: Set[str]) -> list[str]:
+    """check_api_symbols() on an already-parsed module."""
+    mdp_names: dict[str, None] = {}  # insertion-ordered set
     for node in ast.walk(tree):
         if (
             isinstance(node, ast.Attribute)
             and isinstance(node.value, ast.Name)
             and node.value.id == "mdp"
-            and node.attr not in seen
         ):
-            name = node.attr
-            seen.add(name)
-            if name not in whitelist:
-                # Also allow nested access like mdp.UniformVelocityCommandCfg.Ranges
-                # by checking if any whitelist entry is a prefix
-                suggestion = ""
-                matches = difflib.get_close_matches(name, whitelist, n=1, cutoff=0.6)
-                if matches:
-                    suggestion = f" Did you mean: mdp.{matches[0]}?"
-                unknown.append(
-                    f"Unknown MDP function: mdp.{name}.{suggestion}"
-                )
+            mdp_names.setdefault(node.attr)
+    return _unknown_symbol_errors(mdp_names, whitelist)
+
+
+def _unknown_symbol_errors(mdp_names: Iterable[str], whitelist: Set[str]) -> list[str]:
+    """Error messages for the distinct mdp.X names not in the whitelist."""
+    unknown: list[str] = []
+    frozen: frozenset[str] | None = None
+    for name in mdp_names:
+        if name not in whitelist:
+            # Also allow nested access like mdp.UniformVelocityCommandCfg.Ranges
+            # by checking if any whitelist entry is a prefix
+            suggestion = ""
+            if frozen is None:
+                frozen = frozenset(whitelist)
+            match = _suggest(name, frozen)
+            if match is not None:
+                suggestion = f" Did you mean: mdp.{match}?"
+            unknown.append(
+                f"Unknown MDP function: mdp.{name}.{suggestion}"
+            )
 
     return unknown
 
@@ -165,25 +286,78 @@ def validate_config(code: str) -> ValidationResult:
     4. Post-init Check — a __post_init__ method must exist
     5. Import Check — must import from isaaclab or omni.isaac
     6. API Whitelist — all mdp.X symbols must be known
+
+    Results are cached by code, so re-validating unchanged code in a repair
+    loop is free. Each call returns its own copy.
+    """
+    cached = _validate_cached(code, _api_reference_key())
+    return ValidationResult(
+        is_valid=cached.is_valid,
+        errors=list(cached.errors),
+        warnings=list(cached.warnings),
+        corrections=list(cached.corrections),
+    )
+
+
+def clear_caches() -> None:
+    """Drop cached validation results, parsed trees, suggestions and the API whitelist."""
+    _validate_cached.cache_clear()
+    parse_env_cfg.cache_clear()
+    _load_api_whitelist.cache_clear()
+    _suggest.cache_clear()
+
+
+@lru_cache(maxsize=64)
+def _validate_cached(
+    code: str, reference_key: tuple[tuple[str, int], ...]
+) -> ValidationResult:
+    """validate_config() without the defensive copy. Do not mutate the result.
+
+    reference_key ties the cached result to the whitelist it was checked with.
     """
     result = ValidationResult()
 
+    # Every config defines classes; without one this is prose or a stray
+    # snippet, so skip parsing what may be a long LLM response
+    if "class " not in code:
+        result.is_valid = False
+        result.errors.append(
+            "No class definitions found: expected an env config with "
+            "EnvCfg and RewardsCfg classes"
+        )
+        return result
+
     # 1. AST Parse
     try:
-        tree = ast.parse(code)
+        tree = parse_env_cfg(code)
     except SyntaxError as e:
         result.is_valid = False
         result.errors.append(f"SyntaxError at line {e.lineno}: {e.msg}")
         return result  # Can't check further if syntax is broken
 
-    # Collect class names and method names
+    # One walk collects everything the checks below need
     class_names: list[str] = []
     method_names: list[str] = []
+    mdp_names: dict[str, None] = {}  # distinct mdp.X names, in order of use
+    weight_values: list[ast.expr] = []
+    has_isaac_import = False
     for node in ast.walk(tree):
         if isinstance(node, ast.ClassDef):
             class_names.append(node.name)
-        if isinstance(node, ast.FunctionDef):
+        elif isinstance(node, ast.FunctionDef):
             method_names.append(node.name)
+        elif isinstance(node, ast.Attribute):
+            if isinstance(node.value, ast.Name) and node.value.id == "mdp":
+                mdp_names.setdefault(node.attr)
+        elif isinstance(node, ast.keyword):
+            if node.arg == "weight":
+                weight_values.append(node.value)
+        elif isinstance(node, ast.Import):
+            if any("isaaclab" in a.name or "omni.isaac" in a.name for a in node.names):
+                has_isaac_import = True
+        elif isinstance(node, ast.ImportFrom):
+            if node.module and ("isaaclab" in node.module or "omni.isaac" in node.module):
+                has_isaac_import = True
 
     # 2. Class Check — EnvCfg
     has_env_cfg = any("EnvCfg" in name for name in class_names)
@@ -208,17 +382,6 @@ def validate_config(code: str) -> ValidationResult:
         result.errors.append("Missing __post_init__ method")
 
     # 5. Import Check
-    has_isaac_import = False
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                if "isaaclab" in alias.name or "omni.isaac" in alias.name:
-                    has_isaac_import = True
-                    break
-        elif isinstance(node, ast.ImportFrom):
-            if node.module and ("isaaclab" in node.module or "omni.isaac" in node.module):
-                has_isaac_import = True
-
     if not has_isaac_import:
         result.is_valid = False
         result.errors.append(
@@ -226,9 +389,9 @@ def validate_config(code: str) -> ValidationResult:
         )
 
     # 6. API Whitelist Check
-    whitelist = load_api_whitelist()
+    whitelist = _load_api_whitelist(reference_key)
     if whitelist:  # Only check if whitelist was loaded successfully
-        unknown_symbols = check_api_symbols(code, whitelist)
+        unknown_symbols = _unknown_symbol_errors(mdp_names, whitelist)
         if unknown_symbols:
             result.is_valid = False
             result.errors.extend(unknown_symbols)
@@ -242,27 +405,35 @@ def validate_config(code: str) -> ValidationResult:
         )
 
     # 8. Task-specific mdp import check
-    if re.search(r"import\s+isaaclab_tasks\.manager_based\.\S+\.mdp\s+as\s+mdp", code):
+    if "isaaclab_tasks.manager_based" in code and _TASK_MDP_IMPORT_RE.search(code):
         result.warnings.append(
             "Task-specific mdp import found (isaaclab_tasks.manager_based.*.mdp). "
             "Use 'import isaaclab.envs.mdp as mdp' for external configs."
         )
 
     # Warnings: check for unusually large reward weights
-    for node in ast.walk(tree):
-        if isinstance(node, ast.keyword) and node.arg == "weight":
-            if isinstance(node.value, ast.Constant) and isinstance(node.value.value, (int, float)):
-                weight = abs(node.value.value)
-                if weight > 10.0:
-                    result.warnings.append(
-                        f"Unusually large reward weight: {node.value.value}"
-                    )
-            elif isinstance(node.value, ast.UnaryOp) and isinstance(node.value.op, ast.USub):
-                if isinstance(node.value.operand, ast.Constant):
-                    weight = abs(node.value.operand.value)
-                    if weight > 10.0:
-                        result.warnings.append(
-                            f"Unusually large reward weight: -{node.value.operand.value}"
-                        )
+    for value in weight_values:
+        weight = _const_num(value)
+        if weight is not None and abs(weight) > 10.0:
+            result.warnings.append(f"Unusually large reward weight: {weight}")
 
     return result
+
+
+def _const_num(node: ast.expr) -> int | float | None:
+    """Value of a numeric literal such as 5.0 or -5.0, else None."""
+    negate = isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.USub)
+    if negate:
+        node = node.operand
+    if isinstance(node, ast.Constant) and isinstance(node.value, (int, float)):
+        return -node.value if negate else node.value
+    return None
+
+
+def correct_and_validate(code: str) -> tuple[str, list[str], ValidationResult]:
+    """Auto-correct then validate generated code in one call.
+
+    Returns (corrected_code, corrections_applied, validation_result).
+    """
+    corrected, corrections = auto_correct_code(code)
+    return corrected, corrections, validate_config(corrected)
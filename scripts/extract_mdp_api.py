@@ -1,6 +1,8 @@
 """Extract MDP function signatures and docstrings from Isaac Lab source."""
 
 import ast
+import hashlib
+import json
 import os
 import textwrap
 
@@ -21,16 +23,79 @@ FILE_MAP = {
 # For actions, we need to scan the actions/ directory
 ACTIONS_DIR = os.path.join(MDP_DIR, "actions")
 
+# Output files are streamed chunk by chunk; a larger buffer keeps writes few
+WRITE_BUFFER = 1 << 16
 
-def extract_functions_from_file(filepath: str) -> list[dict]:
-    """Extract all top-level function defs with their signatures and docstrings."""
+# Extraction results are cached per source file between runs. Entries are
+# keyed on the file's mtime/size and on this script's own source, so editing
+# either one re-extracts.
+CACHE_DIR = os.path.join(
+    os.path.expanduser(os.getenv("ROBOSPEC_CACHE_DIR", "~/.cache/robospec")),
+    "mdp_extract",
+)
+with open(__file__, "rb") as _f:
+    _SCRIPT_HASH = hashlib.sha256(_f.read()).hexdigest()
+
+
+def cached_extract(kind: str, filepath: str, extract):
+    """Return extract(filepath), reusing a previous run's result if unchanged."""
+    st = os.stat(filepath)
+    key = hashlib.sha256(
+        f"{kind}:{os.path.abspath(filepath)}:{st.st_mtime_ns}:{st.st_size}:{_SCRIPT_HASH}".encode()
+    ).hexdigest()
+    cache_path = os.path.join(CACHE_DIR, f"{key}.json")
+    try:
+        with open(cache_path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        pass
+
+    result = extract(filepath)
+    try:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        # Write to a temp file and rename so a crash never leaves partial JSON
+        tmp = f"{cache_path}.{os.getpid()}.tmp"
+        with open(tmp, "w") as f:
+            json.dump(result, f)
+        os.replace(tmp, cache_path)
+    except OSError:
+        pass
+    return result
+
+
+def read_module(filepath: str) -> tuple[str, ast.Module]:
+    """Read and parse a source file, returning (source, tree)."""
     with open(filepath) as f:
         source = f.read()
+    return source, ast.parse(source)
+
+
+def extract_functions_from_file(filepath: str) -> list[dict]:
+    """Extract all top-level function defs with their signatures and docstrings."""
+    return functions_from_tree(*read_module(filepath))
+
 
-    tree = ast.parse(source)
+def extract_classes_from_file(filepath: str) -> list[dict]:
+    """Extract class definitions (for action configs)."""
+    _source, tree = read_module(filepath)
+    return classes_from_tree(tree)
+
+
+def extract_actions_from_file(filepath: str) -> dict[str, list[dict]]:
+    """Extract both classes and helper functions from one parse of an actions file."""
+    source, tree = read_module(filepath)
+    return {
+        "classes": classes_from_tree(tree),
+        "functions": functions_from_tree(source, tree),
+    }
+
+
+def functions_from_tree(source: str, tree: ast.Module) -> list[dict]:
+    """Top-level public function defs of a parsed module."""
     functions = []
 
-    for node in ast.walk(tree):
+    # Only module-level defs: nested helpers and class methods are not mdp terms
+    for node in ast.iter_child_nodes(tree):
         if isinstance(node, ast.FunctionDef) and not node.name.startswith("_"):
             # Get the full signature from source lines
             sig = get_signature(node, source)
@@ -46,12 +111,8 @@ def extract_functions_from_file(filepath: str) -> list[dict]:
     return functions
 
 
-def extract_classes_from_file(filepath: str) -> list[dict]:
-    """Extract class definitions (for action configs)."""
-    with open(filepath) as f:
-        source = f.read()
-
-    tree = ast.parse(source)
+def classes_from_tree(tree: ast.Module) -> list[dict]:
+    """Top-level public class defs of a parsed module."""
     classes = []
 
     for node in ast.iter_child_nodes(tree):
@@ -73,6 +134,17 @@ def extract_classes_from_file(filepath: str) -> list[dict]:
     return classes
 
 
+def unparse_annotation(annotation: ast.expr | None) -> str:
+    """ast.unparse() for annotations, with a fast path for `T` and `mod.T`."""
+    if annotation is None:
+        return ""
+    if isinstance(annotation, ast.Name):
+        return annotation.id
+    if isinstance(annotation, ast.Attribute) and isinstance(annotation.value, ast.Name):
+        return f"{annotation.value.id}.{annotation.attr}"
+    return ast.unparse(annotation)
+
+
 def get_signature(node: ast.FunctionDef, source: str) -> str:
     """Reconstruct function signature from AST."""
     args = []
@@ -81,7 +153,7 @@ def get_signature(node: ast.FunctionDef, source: str) -> str:
     # Positional args
     defaults_offset = len(all_args.args) - len(all_args.defaults)
     for i, arg in enumerate(all_args.args):
-        annotation = ast.unparse(arg.annotation) if arg.annotation else ""
+        annotation = unparse_annotation(arg.annotation)
         name = arg.arg
         default_idx = i - defaults_offset
         if default_idx >= 0 and default_idx < len(all_args.defaults):
@@ -103,7 +175,7 @@ def get_signature(node: ast.FunctionDef, source: str) -> str:
     # keyword-only args
     kw_defaults = all_args.kw_defaults
     for i, arg in enumerate(all_args.kwonlyargs):
-        annotation = ast.unparse(arg.annotation) if arg.annotation else ""
+        annotation = unparse_annotation(arg.annotation)
         name = arg.arg
         default = kw_defaults[i]
         if default:
@@ -124,7 +196,7 @@ def get_signature(node: ast.FunctionDef, source: str) -> str:
 
     ret = ""
     if node.returns:
-        ret = f" -> {ast.unparse(node.returns)}"
+        ret = f" -> {unparse_annotation(node.returns)}"
 
     return f"{node.name}({', '.join(args)}){ret}"
 
@@ -135,10 +207,10 @@ def extract_params(node: ast.FunctionDef) -> list[tuple[str, str]]:
     for arg in node.args.args:
         if arg.arg == "self":
             continue
-        annotation = ast.unparse(arg.annotation) if arg.annotation else "Any"
+        annotation = unparse_annotation(arg.annotation) or "Any"
         params.append((arg.arg, annotation))
     for arg in node.args.kwonlyargs:
-        annotation = ast.unparse(arg.annotation) if arg.annotation else "Any"
+        annotation = unparse_annotation(arg.annotation) or "Any"
         params.append((arg.arg, annotation))
     return params
 
@@ -172,6 +244,17 @@ def format_class_md(cls: dict) -> str:
     return "\n".join(lines)
 
 
+def write_md_chunks(f, chunks: list[str]) -> None:
+    """Append chunks to ``f``, each preceded by the "\\n" separator.
+
+    Streaming the chunks matches what "\\n".join() used to produce without
+    building the whole reference file as one string first.
+    """
+    for chunk in chunks:
+        f.write("\n")
+        f.write(chunk)
+
+
 def main():
     os.makedirs(OUTPUT_DIR, exist_ok=True)
 
@@ -182,21 +265,19 @@ def main():
             print(f"WARNING: {filepath} not found, skipping")
             continue
 
-        functions = extract_functions_from_file(filepath)
+        functions = cached_extract("functions", filepath, extract_functions_from_file)
         category = src_file.replace(".py", "").replace("_", " ").title()
 
-        md_lines = [f"# Isaac Lab MDP {category}\n"]
-        md_lines.append(f"Extracted from `isaaclab.envs.mdp.{src_file.replace('.py', '')}`\n")
-        md_lines.append(f"Total functions: {len(functions)}\n")
-        md_lines.append("---\n")
-
-        for func in functions:
-            md_lines.append(format_function_md(func))
-            md_lines.append("---\n")
-
         out_path = os.path.join(OUTPUT_DIR, out_file)
-        with open(out_path, "w") as f:
-            f.write("\n".join(md_lines))
+        with open(out_path, "w", buffering=WRITE_BUFFER) as f:
+            f.write(f"# Isaac Lab MDP {category}\n")
+            write_md_chunks(f, [
+                f"Extracted from `isaaclab.envs.mdp.{src_file.replace('.py', '')}`\n",
+                f"Total functions: {len(functions)}\n",
+                "---\n",
+            ])
+            for func in functions:
+                write_md_chunks(f, [format_function_md(func), "---\n"])
         print(f"Wrote {out_path} ({len(functions)} functions)")
 
     # Extract actions from the actions/ directory
@@ -206,27 +287,25 @@ def main():
         for fname in sorted(os.listdir(ACTIONS_DIR)):
             if fname.endswith(".py") and not fname.startswith("_"):
                 fpath = os.path.join(ACTIONS_DIR, fname)
-                all_classes.extend(extract_classes_from_file(fpath))
-                all_functions.extend(extract_functions_from_file(fpath))
-
-        md_lines = ["# Isaac Lab MDP Actions\n"]
-        md_lines.append("Extracted from `isaaclab.envs.mdp.actions`\n")
-        md_lines.append(f"Total action classes: {len(all_classes)}\n")
-        md_lines.append("---\n")
-
-        for cls in all_classes:
-            md_lines.append(format_class_md(cls))
-            md_lines.append("---\n")
-
-        if all_functions:
-            md_lines.append("\n## Helper Functions\n")
-            for func in all_functions:
-                md_lines.append(format_function_md(func))
-                md_lines.append("---\n")
+                extracted = cached_extract("actions", fpath, extract_actions_from_file)
+                all_classes.extend(extracted["classes"])
+                all_functions.extend(extracted["functions"])
 
         out_path = os.path.join(OUTPUT_DIR, "mdp_actions.md")
-        with open(out_path, "w") as f:
-            f.write("\n".join(md_lines))
+        with open(out_path, "w", buffering=WRITE_BUFFER) as f:
+            f.write("# Isaac Lab MDP Actions\n")
+            write_md_chunks(f, [
+                "Extracted from `isaaclab.envs.mdp.actions`\n",
+                f"Total action classes: {len(all_classes)}\n",
+                "---\n",
+            ])
+            for cls in all_classes:
+                write_md_chunks(f, [format_class_md(cls), "---\n"])
+
+            if all_functions:
+                write_md_chunks(f, ["\n## Helper Functions\n"])
+                for func in all_functions:
+                    write_md_chunks(f, [format_function_md(func), "---\n"])
         print(f"Wrote {out_path} ({len(all_classes)} classes, {len(all_functions)} functions)")
 
 
@@ -2,6 +2,8 @@
 
 import asyncio
 import io
+import threading
+import weakref
 import zipfile
 from pathlib import Path
 
@@ -9,17 +11,15 @@ import streamlit as st
 
 from robospec.nemotron.client import NemotronClient
 from robospec.pipeline.analyzer import analyze_task
-from robospec.pipeline.context import build_context
+from robospec.pipeline.context import build_context, estimate_tokens
 from robospec.pipeline.generator import (
     generate_config,
     repair_config,
     _build_config,
-    _make_task_name,
-    _make_task_id,
 )
 from robospec.pipeline.validator import (
-    validate_config,
-    auto_correct_code,
+    _api_reference_key,
+    correct_and_validate,
     load_api_whitelist,
 )
 from robospec.pipeline.explainer import explain_config
@@ -36,6 +36,15 @@ EXAMPLE_PROMPTS = [
     "Navigate rough terrain with a quadruped",
 ]
 
+# Badge variant -> (text, background, border) colors
+BADGE_COLORS = {
+    "success": ("#16a34a", "#f0fdf4", "#bbf7d0"),
+    "error": ("#dc2626", "#fef2f2", "#fecaca"),
+    "warning": ("#d97706", "#fffbeb", "#fde68a"),
+    "info": ("#2563eb", "#eff6ff", "#bfdbfe"),
+    "default": ("#71717a", "#f4f4f5", "#e4e4e7"),
+}
+
 # ---------------------------------------------------------------------------
 # Page config
 # ---------------------------------------------------------------------------
@@ -173,14 +182,7 @@ st.markdown("""
 
 def badge(text: str, variant: str = "default") -> str:
     """Return an HTML badge span."""
-    colors = {
-        "success": ("#16a34a", "#f0fdf4", "#bbf7d0"),
-        "error": ("#dc2626", "#fef2f2", "#fecaca"),
-        "warning": ("#d97706", "#fffbeb", "#fde68a"),
-        "info": ("#2563eb", "#eff6ff", "#bfdbfe"),
-        "default": ("#71717a", "#f4f4f5", "#e4e4e7"),
-    }
-    text_c, bg_c, border_c = colors.get(variant, colors["default"])
+    text_c, bg_c, border_c = BADGE_COLORS.get(variant, BADGE_COLORS["default"])
     return (
         f'<span style="display:inline-block;padding:2px 10px;border-radius:9999px;'
         f'font-size:12px;font-weight:500;line-height:1.6;'
@@ -189,26 +191,54 @@ def badge(text: str, variant: str = "default") -> str:
     )
 
 
+# Deflating files this small costs more than the bytes it saves
+ZIP_STORE_BELOW = 1024
+# On a few KB of generated Python, level 1 deflates about twice as fast as
+# the default 6 for output under 10% larger
+ZIP_DEFLATE_LEVEL = 1
+
+
 def create_zip(config) -> bytes:
     """Build an in-memory zip archive of all generated files."""
+    entries = [(f"{config.task_name}_env_cfg.py", config.env_cfg)]
+    if config.init_py:
+        entries.append(("__init__.py", config.init_py))
+    if config.train_script:
+        entries.append(("train.py", config.train_script))
+    if config.readme:
+        entries.append(("README.md", config.readme))
+    return _build_zip(tuple(entries))
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def _build_zip(entries: tuple[tuple[str, str], ...]) -> bytes:
+    """Zip (arcname, text) pairs. Cached so reruns don't rebuild the archive."""
     buf = io.BytesIO()
-    with zipfile.ZipFile(buf, "w", zipfile.ZIP_DEFLATED) as zf:
-        zf.writestr(f"{config.task_name}_env_cfg.py", config.env_cfg)
-        if config.init_py:
-            zf.writestr("__init__.py", config.init_py)
-        if config.train_script:
-            zf.writestr("train.py", config.train_script)
-        if config.readme:
-            zf.writestr("README.md", config.readme)
+    with zipfile.ZipFile(
+        buf, "w", zipfile.ZIP_DEFLATED, compresslevel=ZIP_DEFLATE_LEVEL
+    ) as zf:
+        for arcname, text in entries:
+            data = text.encode()
+            small = len(data) < ZIP_STORE_BELOW
+            zf.writestr(arcname, data, compress_type=zipfile.ZIP_STORED if small else None)
     return buf.getvalue()
 
 
+@st.cache_data(show_spinner=False, max_entries=4)
+def _full_whitelist_hint(reference_key: tuple[tuple[str, int], ...]) -> str:
+    """The sorted whitelist hint, kept across reruns and sessions.
+
+    Keyed on the API reference files' paths and mtimes, like the validator's
+    whitelist cache, so a regenerated reference refreshes the hint too.
+    """
+    return "AVAILABLE MDP FUNCTIONS (use ONLY these):\n" + ", ".join(sorted(load_api_whitelist()))
+
+
 def _build_whitelist_hint(errors: list[str]) -> str:
     """If errors include unknown API symbols, build a hint with the full whitelist."""
     if not any("Unknown MDP function" in e for e in errors):
         return ""
-    whitelist = load_api_whitelist()
-    return "AVAILABLE MDP FUNCTIONS (use ONLY these):\n" + ", ".join(sorted(whitelist))
+    return _full_whitelist_hint(_api_reference_key())
 
 
 # ---------------------------------------------------------------------------
@@ -231,86 +261,130 @@ for key, default in {
 # Pipeline
 # ---------------------------------------------------------------------------
 
-async def run_pipeline(description: str, status_widget):
-    """Run the full RoboSpec pipeline, writing progress to status_widget."""
-    client = NemotronClient()
+class _SessionRuntime:
+    """A session's event loop and NemotronClient, reused across Generate clicks.
+
+    The client's connection pool is bound to the loop it first ran on, so the
+    two are kept together; a fresh asyncio.run() would bring a new loop and new
+    TLS handshakes. When Streamlit drops the session's state the runtime is
+    collected and its finalizer closes the client and loop (weakref.finalize
+    also runs it at interpreter exit), so ended sessions don't keep pools open.
+    """
+
+    def __init__(self) -> None:
+        self.loop = asyncio.new_event_loop()
+        self.client = NemotronClient()
+        weakref.finalize(self, _close_session_runtime, self.loop, self.client)
+
+
+def _get_session_runtime() -> _SessionRuntime:
+    """This session's runtime, created on first use."""
+    runtime = st.session_state.get("_runtime")
+    if runtime is None:
+        runtime = _SessionRuntime()
+        st.session_state["_runtime"] = runtime
+    return runtime
+
 
+def _close_session_runtime(loop: asyncio.AbstractEventLoop, client: NemotronClient) -> None:
+    """Close a session's client and loop once its runtime is gone.
+
+    The finalizer runs on whichever thread triggers collection; if that thread
+    is already running an event loop (Streamlit's server thread), the close is
+    done on a short-lived worker thread instead.
+    """
+    if loop.is_closed() or loop.is_running():
+        return
     try:
-        # 1. Analyze
-        status_widget.write("Analyzing task description...")
-        task_spec = await analyze_task(client, description)
-        st.session_state["task_spec"] = task_spec
-        status_widget.write(
-            f"Detected **{task_spec.category.value}** with **{task_spec.robot.value}**"
-        )
+        asyncio.get_running_loop()
+    except RuntimeError:
+        _shutdown_runtime(loop, client)
+        return
+    worker = threading.Thread(target=_shutdown_runtime, args=(loop, client), daemon=True)
+    worker.start()
+    worker.join()
+
+
+def _shutdown_runtime(loop: asyncio.AbstractEventLoop, client: NemotronClient) -> None:
+    try:
+        loop.run_until_complete(client.close())
+    finally:
+        loop.close()
 
-        # 2. Context
-        status_widget.write("Building Isaac Lab reference context...")
-        context = build_context(task_spec)
-        tokens_est = len(context) // 4
-        status_widget.write(f"Context ready (~{tokens_est:,} tokens)")
-
-        # 3. Generate
-        status_widget.write("Generating Isaac Lab configuration...")
-        config = await generate_config(client, task_spec, context)
-
-        # 4. Auto-correct + Validate
-        task_name = _make_task_name(task_spec)
-        task_id = _make_task_id(task_spec)
-
-        best_code, corrections = auto_correct_code(config.env_cfg)
-        st.session_state["corrections"] = corrections
-        if corrections:
-            status_widget.write(
-                f"Auto-corrected {len(corrections)} hallucination(s)"
-            )
 
-        status_widget.write("Validating generated code...")
-        result = validate_config(best_code)
+async def run_pipeline(client: NemotronClient, description: str, status_widget):
+    """Run the full RoboSpec pipeline, writing progress to status_widget."""
+    # 1. Analyze
+    status_widget.write("Analyzing task description...")
+    task_spec = await analyze_task(client, description)
+    st.session_state["task_spec"] = task_spec
+    status_widget.write(
+        f"Detected **{task_spec.category.value}** with **{task_spec.robot.value}**"
+    )
 
-        # 5. Repair loop (up to 2 attempts)
-        repair_log: list[str] = []
-        for attempt in range(MAX_REPAIR_ATTEMPTS):
-            if result.is_valid:
-                break
+    # 2. Context — file reads and tokenizing ~400KB of reference text, so run
+    # them in a worker thread rather than on the event loop
+    status_widget.write("Building Isaac Lab reference context...")
+    loop = asyncio.get_running_loop()
+    context = await loop.run_in_executor(None, build_context, task_spec)
+    tokens_est = await loop.run_in_executor(None, estimate_tokens, context)
+    status_widget.write(f"Context ready (~{tokens_est:,} tokens)")
+
+    # 3. Generate — load the validator's API whitelist in the background
+    # while the model is busy
+    status_widget.write("Generating Isaac Lab configuration...")
+    whitelist_future = loop.run_in_executor(None, load_api_whitelist)
+    config = await generate_config(client, task_spec, context)
+
+    # 4. Auto-correct + Validate
+    await whitelist_future
+    status_widget.write("Validating generated code...")
+    best_code, corrections, result = correct_and_validate(config.env_cfg)
+    st.session_state["corrections"] = corrections
+    if corrections:
+        status_widget.write(
+            f"Auto-corrected {len(corrections)} hallucination(s)"
+        )
 
-            msg = f"Repair attempt {attempt + 1}/{MAX_REPAIR_ATTEMPTS}..."
-            status_widget.write(msg)
-            repair_log.append(msg)
+    # 5. Repair loop (up to 2 attempts)
+    repair_log: list[str] = []
+    for attempt in range(MAX_REPAIR_ATTEMPTS):
+        if result.is_valid:
+            break
 
-            whitelist_hint = _build_whitelist_hint(result.errors)
-            repaired_code = await repair_config(
-                client, best_code, result.errors, context, whitelist_hint
-            )
-            best_code, repair_corrections = auto_correct_code(repaired_code)
-            corrections.extend(repair_corrections)
+        msg = f"Repair attempt {attempt + 1}/{MAX_REPAIR_ATTEMPTS}..."
+        status_widget.write(msg)
+        repair_log.append(msg)
 
-            status_widget.write("Re-validating...")
-            result = validate_config(best_code)
+        whitelist_hint = _build_whitelist_hint(result.errors)
+        repaired_code = await repair_config(
+            client, best_code, result.errors, context, whitelist_hint
+        )
+        status_widget.write("Re-validating...")
+        best_code, repair_corrections, result = correct_and_validate(repaired_code)
+        corrections.extend(repair_corrections)
 
-        st.session_state["repair_log"] = repair_log
-        st.session_state["validation"] = result
-        st.session_state["corrections"] = corrections
+    st.session_state["repair_log"] = repair_log
+    st.session_state["validation"] = result
+    st.session_state["corrections"] = corrections
 
-        # 6. Rebuild config with best code
+    # 6. Rebuild config with best code (already post-processed if unchanged)
+    if best_code != config.env_cfg:
         config = _build_config(
             best_code,
             config.raw_response,
-            task_name,
-            task_id,
+            config.task_name,
+            config.task_id,
             task_spec.num_envs,
             task_spec.category.value,
         )
 
-        # 7. Explain
-        status_widget.write("Generating reward explanation...")
-        config.readme = await explain_config(client, config.env_cfg, description)
+    # 7. Explain
+    status_widget.write("Generating reward explanation...")
+    config.readme = await explain_config(client, config.env_cfg, description)
 
-        st.session_state["config"] = config
-        st.session_state["generated"] = True
-
-    finally:
-        await client.close()
+    st.session_state["config"] = config
+    st.session_state["generated"] = True
 
 
 # ---------------------------------------------------------------------------
@@ -426,7 +500,8 @@ if generate_btn and description.strip():
     st.session_state["generated"] = False
 
     with st.status("Generating Isaac Lab configuration...", expanded=True) as status:
-        asyncio.run(run_pipeline(description, status))
+        runtime = _get_session_runtime()
+        runtime.loop.run_until_complete(run_pipeline(runtime.client, description, status))
 
         if st.session_state.get("validation") and st.session_state["validation"].is_valid:
             status.update(label="Generation complete", state="complete", expanded=False)
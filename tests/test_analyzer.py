@@ -1,14 +1,17 @@
 """Tests for the task analyzer."""
 
+import asyncio
 import json
 import pytest
 
 from robospec.pipeline.analyzer import (
+    JSON_RETRY_PREFIX,
     TaskCategory,
     RobotType,
     TaskSpec,
     _extract_json,
     _parse_task_spec,
+    analyze_task,
 )
 
 
@@ -77,6 +80,11 @@ class TestParseTaskSpec:
         with pytest.raises(ValueError):
             _parse_task_spec(data, "fly")
 
+    def test_unhashable_category_raises_value_error(self):
+        data = {"category": ["classic_cartpole"], "robot": "cartpole"}
+        with pytest.raises(ValueError):
+            _parse_task_spec(data, "balance pole")
+
 
 class TestTaskSpecMapping:
     """Verify expected category-robot mappings (unit tests, no API calls)."""
@@ -100,3 +108,34 @@ class TestTaskSpecMapping:
         spec = _parse_task_spec(data, "test")
         assert spec.category == TaskCategory(category)
         assert spec.robot == RobotType(robot)
+
+
+VALID_SPEC_JSON = json.dumps({"category": "classic_cartpole", "robot": "cartpole"})
+
+
+class _FakeClient:
+    """Answers the strict JSON-only prompt and the normal prompt separately."""
+
+    def __init__(self, normal, strict):
+        self.normal = normal
+        self.strict = strict
+
+    async def generate(self, system_prompt, user_prompt, temperature, max_tokens):
+        reply = self.strict if user_prompt.startswith(JSON_RETRY_PREFIX) else self.normal
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+
+class TestSpeculativeAnalyze:
+    def test_transport_error_falls_back_to_other_request(self, monkeypatch):
+        monkeypatch.setenv("ROBOSPEC_SPECULATIVE_ANALYZE", "1")
+        client = _FakeClient(normal=RuntimeError("connection reset"), strict=VALID_SPEC_JSON)
+        spec = asyncio.run(analyze_task(client, "balance pole"))
+        assert spec.category == TaskCategory.CLASSIC_CARTPOLE
+
+    def test_raises_when_both_requests_fail(self, monkeypatch):
+        monkeypatch.setenv("ROBOSPEC_SPECULATIVE_ANALYZE", "1")
+        client = _FakeClient(normal=RuntimeError("connection reset"), strict="not json")
+        with pytest.raises(ValueError):
+            asyncio.run(analyze_task(client, "balance pole"))
@@ -0,0 +1,75 @@
+"""Tests for the on-disk completion cache."""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+from robospec.nemotron.cache import DEFAULT_TTL_S, DiskCache
+
+
+MESSAGES = [
+    {"role": "system", "content": "You are RoboSpec."},
+    {"role": "user", "content": "Balance a pole on a cart"},
+]
+
+
+class TestMakeKey:
+    def test_same_request_same_key(self):
+        a = DiskCache.make_key("model", MESSAGES, 0.1, 1024)
+        b = DiskCache.make_key("model", list(MESSAGES), 0.1, 1024)
+        assert a == b
+
+    def test_key_depends_on_temperature(self):
+        a = DiskCache.make_key("model", MESSAGES, 0.1, 1024)
+        b = DiskCache.make_key("model", MESSAGES, 0.0, 1024)
+        assert a != b
+
+    def test_key_depends_on_messages(self):
+        other = [MESSAGES[0], {"role": "user", "content": "Walk forward"}]
+        a = DiskCache.make_key("model", MESSAGES, 0.1, 1024)
+        b = DiskCache.make_key("model", other, 0.1, 1024)
+        assert a != b
+
+
+class TestDiskCache:
+    def test_roundtrip(self, tmp_path):
+        cache = DiskCache(cache_dir=tmp_path, ttl_s=60)
+        cache.set("abc", "hello {world}")
+        assert cache.get("abc") == "hello {world}"
+
+    def test_miss_returns_none(self, tmp_path):
+        cache = DiskCache(cache_dir=tmp_path, ttl_s=60)
+        assert cache.get("missing") is None
+
+    def test_expired_entry_is_miss(self, tmp_path):
+        cache = DiskCache(cache_dir=tmp_path, ttl_s=60)
+        cache.set("abc", "stale")
+        old = time.time() - 120
+        os.utime(tmp_path / "abc.json", (old, old))
+        assert cache.get("abc") is None
+
+    def test_zero_ttl_disables(self, tmp_path):
+        cache = DiskCache(cache_dir=tmp_path, ttl_s=0)
+        cache.set("abc", "value")
+        assert not cache.enabled
+        assert cache.get("abc") is None
+        assert list(tmp_path.iterdir()) == []
+
+    def test_corrupt_entry_is_miss(self, tmp_path):
+        cache = DiskCache(cache_dir=tmp_path, ttl_s=60)
+        (tmp_path / "abc.json").write_text("not json")
+        assert cache.get("abc") is None
+
+
+class TestEnvConfig:
+    def test_cache_dir_expands_user(self, monkeypatch):
+        monkeypatch.setenv("ROBOSPEC_CACHE_DIR", "~/.cache/robospec")
+        assert DiskCache().cache_dir == Path.home() / ".cache" / "robospec"
+
+    def test_invalid_ttl_falls_back_to_default(self, monkeypatch):
+        monkeypatch.setenv("ROBOSPEC_CACHE_TTL", "one day")
+        with pytest.warns(UserWarning, match="ROBOSPEC_CACHE_TTL"):
+            cache = DiskCache()
+        assert cache.ttl_s == DEFAULT_TTL_S
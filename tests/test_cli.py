@@ -0,0 +1,57 @@
+"""Tests for the CLI's concurrent repair race (no network; repair_config is faked)."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from robospec.cli import REPAIR_RACE_TEMPERATURES, _race_repairs
+from robospec.pipeline import generator
+
+VALID_CODE = '''
+from isaaclab.envs import ManagerBasedRLEnvCfg
+from isaaclab.utils import configclass
+from isaaclab.managers import RewardTermCfg as RewTerm
+from isaaclab.envs.mdp import rewards as mdp
+
+@configclass
+class RewardsCfg:
+    reward_1 = RewTerm(func=mdp.is_alive, weight=1.0)
+
+@configclass
+class MyEnvCfg(ManagerBasedRLEnvCfg):
+    rewards: RewardsCfg = RewardsCfg()
+
+    def __post_init__(self):
+        self.decimation = 4
+        self.episode_length_s = 5.0
+        self.sim.dt = 0.005
+'''
+
+
+def _fake_repair(replies: dict):
+    async def repair_config(client, code, errors, context, whitelist_hint, temperature):
+        reply = replies[temperature]
+        if isinstance(reply, Exception):
+            raise reply
+        return reply
+
+    return repair_config
+
+
+def _race(monkeypatch, replies: dict):
+    monkeypatch.setattr(generator, "repair_config", _fake_repair(replies))
+    return asyncio.run(_race_repairs(None, "broken", ["error"], "", ""))
+
+
+class TestRaceRepairs:
+    def test_failed_candidate_does_not_abort_race(self, monkeypatch):
+        low, high = REPAIR_RACE_TEMPERATURES
+        code, _, result = _race(monkeypatch, {low: httpx.ReadTimeout("slow"), high: VALID_CODE})
+        assert result.is_valid
+        assert "MyEnvCfg" in code
+
+    def test_raises_when_every_candidate_fails(self, monkeypatch):
+        replies = {t: httpx.ConnectError("down") for t in REPAIR_RACE_TEMPERATURES}
+        with pytest.raises(httpx.ConnectError):
+            _race(monkeypatch, replies)
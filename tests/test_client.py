@@ -0,0 +1,63 @@
+"""Tests for NemotronClient's streaming path (no network; httpx mock transport)."""
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from robospec.nemotron.cache import DiskCache
+from robospec.nemotron.client import NemotronClient
+
+
+def _sse(*frames: str) -> bytes:
+    return "".join(f"data: {frame}\n\n" for frame in frames).encode()
+
+
+def _delta(text: str, finish_reason: str | None = None) -> str:
+    choice = {"delta": {"content": text}, "finish_reason": finish_reason}
+    return json.dumps({"choices": [choice]})
+
+
+def _make_client(monkeypatch, tmp_path, body: bytes) -> NemotronClient:
+    monkeypatch.setenv("NVIDIA_API_KEY", "nvapi-test")
+    monkeypatch.delenv("OPENROUTER_API_KEY", raising=False)
+    client = NemotronClient(cache=DiskCache(cache_dir=tmp_path, ttl_s=60))
+    client.client = httpx.AsyncClient(
+        transport=httpx.MockTransport(lambda request: httpx.Response(200, content=body))
+    )
+    return client
+
+
+def _stream(client: NemotronClient) -> str:
+    async def run() -> str:
+        try:
+            return "".join([c async for c in client.generate_stream("sys", "user", 0.0)])
+        finally:
+            await client.close()
+
+    return asyncio.run(run())
+
+
+class TestGenerateStream:
+    def test_complete_stream_is_cached(self, monkeypatch, tmp_path):
+        client = _make_client(monkeypatch, tmp_path, _sse(_delta("a"), _delta("b"), "[DONE]"))
+        assert _stream(client) == "ab"
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_stop_finish_reason_counts_as_complete(self, monkeypatch, tmp_path):
+        client = _make_client(monkeypatch, tmp_path, _sse(_delta("a", "stop")))
+        assert _stream(client) == "a"
+        assert len(list(tmp_path.glob("*.json"))) == 1
+
+    def test_truncated_stream_is_not_cached(self, monkeypatch, tmp_path):
+        client = _make_client(monkeypatch, tmp_path, _sse(_delta("a"), _delta("b")))
+        assert _stream(client) == "ab"
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_error_frame_raises(self, monkeypatch, tmp_path):
+        body = _sse(_delta("a"), '{"error": {"message": "overloaded"}}', "[DONE]")
+        client = _make_client(monkeypatch, tmp_path, body)
+        with pytest.raises(RuntimeError, match="overloaded"):
+            _stream(client)
+        assert list(tmp_path.glob("*.json")) == []
@@ -0,0 +1,46 @@
+"""Tests for the knowledge-base context builder's caching."""
+
+import os
+
+from robospec.pipeline import context
+from robospec.pipeline.analyzer import TaskSpec, TaskCategory, RobotType
+from robospec.pipeline.context import build_context
+
+
+def _spec() -> TaskSpec:
+    return TaskSpec(
+        category=TaskCategory.CLASSIC_CARTPOLE,
+        robot=RobotType.CARTPOLE,
+        description="test",
+        objectives=[],
+        constraints=[],
+    )
+
+
+def _write(path, text: str, mtime_ns: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(text)
+    os.utime(path, ns=(mtime_ns, mtime_ns))
+
+
+class TestBuildContextCache:
+    def test_edited_knowledge_files_are_picked_up(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(context, "KNOWLEDGE_DIR", tmp_path)
+        patterns = tmp_path / "reward_patterns.md"
+        example = tmp_path / "examples" / "cartpole_env_cfg.py"
+        _write(patterns, "old pattern", 1_000_000_000)
+        _write(example, "old_example = 1", 1_000_000_000)
+        first = build_context(_spec())
+        assert "old pattern" in first and "old_example" in first
+        assert build_context(_spec()) is first
+
+        _write(patterns, "new pattern", 2_000_000_000)
+        _write(example, "new_example = 1", 2_000_000_000)
+        second = build_context(_spec())
+        assert "new pattern" in second and "new_example" in second
+
+    def test_added_knowledge_file_is_picked_up(self, monkeypatch, tmp_path):
+        monkeypatch.setattr(context, "KNOWLEDGE_DIR", tmp_path)
+        assert "ROBOT SPECIFICATIONS" not in build_context(_spec())
+        _write(tmp_path / "robots.json", "{}", 1_000_000_000)
+        assert "ROBOT SPECIFICATIONS" in build_context(_spec())
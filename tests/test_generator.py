@@ -3,6 +3,7 @@
 import ast
 import pytest
 
+from robospec.pipeline import generator
 from robospec.pipeline.generator import (
     _parse_response,
     _strip_code_fences,
@@ -17,6 +18,10 @@ from robospec.pipeline.generator import (
 )
 from robospec.pipeline.analyzer import TaskSpec, TaskCategory, RobotType
 
+# Every category/robot combination, one test case each
+ALL_SPECS = [(cat, robot) for cat in TaskCategory for robot in RobotType]
+ALL_SPEC_IDS = [f"{cat.value}-{robot.value}" for cat, robot in ALL_SPECS]
+
 
 class TestSanitizeModuleName:
     def test_replaces_hyphens(self):
@@ -37,6 +42,17 @@ class TestSanitizeModuleName:
     def test_mixed(self):
         assert sanitize_module_name("My-Task 2!") == "my_task_2"
 
+    def test_ascii_input_skips_regex(self, monkeypatch):
+        class _NoRegex:
+            def sub(self, *args):
+                raise AssertionError("regex fallback used for ASCII input")
+
+        monkeypatch.setattr(generator, "_MODULE_NAME_INVALID_RE", _NoRegex())
+        assert sanitize_module_name("My-Task 2!") == "my_task_2"
+
+    def test_strips_non_ascii(self):
+        assert sanitize_module_name("Café-Reach") == "caf_reach"
+
 
 class TestStripCodeFences:
     def test_python_fences(self):
@@ -139,17 +155,16 @@ class TestMakeTaskName:
         )
         assert _make_task_name(spec) == "anymal_d_rough"
 
-    def test_no_hyphens_in_any_name(self):
+    @pytest.mark.parametrize("cat,robot", ALL_SPECS, ids=ALL_SPEC_IDS)
+    def test_no_hyphens_in_any_name(self, cat, robot):
         """All task names must be valid Python module names (no hyphens)."""
-        for cat in TaskCategory:
-            for robot in RobotType:
-                spec = TaskSpec(
-                    category=cat, robot=robot,
-                    description="test", objectives=[], constraints=[],
-                )
-                name = _make_task_name(spec)
-                assert "-" not in name, f"Hyphen found in task name: {name}"
-                assert name.isidentifier(), f"Not a valid Python identifier: {name}"
+        spec = TaskSpec(
+            category=cat, robot=robot,
+            description="test", objectives=[], constraints=[],
+        )
+        name = _make_task_name(spec)
+        assert "-" not in name, f"Hyphen found in task name: {name}"
+        assert name.isidentifier(), f"Not a valid Python identifier: {name}"
 
 
 class TestMakeTaskId:
@@ -185,18 +200,17 @@ class TestMakeTaskId:
         )
         assert _make_task_id(spec) == "RoboSpec-Velocity-Rough-Anymal-D-v0"
 
-    def test_all_ids_start_with_robospec(self):
+    @pytest.mark.parametrize("cat,robot", ALL_SPECS, ids=ALL_SPEC_IDS)
+    def test_all_ids_start_with_robospec(self, cat, robot):
         """Every task ID must start with 'RoboSpec-' to avoid collisions."""
-        for cat in TaskCategory:
-            for robot in RobotType:
-                spec = TaskSpec(
-                    category=cat, robot=robot,
-                    description="test", objectives=[], constraints=[],
-                )
-                task_id = _make_task_id(spec)
-                assert task_id.startswith("RoboSpec-"), (
-                    f"Task ID '{task_id}' does not start with 'RoboSpec-'"
-                )
+        spec = TaskSpec(
+            category=cat, robot=robot,
+            description="test", objectives=[], constraints=[],
+        )
+        task_id = _make_task_id(spec)
+        assert task_id.startswith("RoboSpec-"), (
+            f"Task ID '{task_id}' does not start with 'RoboSpec-'"
+        )
 
 
 class TestFindEnvCfgClass:
@@ -243,26 +257,25 @@ class TestGenerateInitPy:
         assert "FrankaReachPPORunnerCfg" in result
         assert "skrl_ppo_cfg.yaml" in result
 
-    def test_entry_point_matches_filename(self):
+    @pytest.mark.parametrize("cat,robot", ALL_SPECS, ids=ALL_SPEC_IDS)
+    def test_entry_point_matches_filename(self, cat, robot):
         """The env_cfg_entry_point module must match the actual env_cfg filename."""
-        for cat in TaskCategory:
-            for robot in RobotType:
-                spec = TaskSpec(
-                    category=cat, robot=robot,
-                    description="test", objectives=[], constraints=[],
-                )
-                task_name = _make_task_name(spec)
-                task_id = _make_task_id(spec)
-                train_cfg = CATEGORY_TRAIN_CONFIG.get(cat.value)
-                init_py = _generate_init_py(task_name, task_id, "TestEnvCfg", train_cfg)
-                expected_module = f"{task_name}_env_cfg"
-                assert expected_module in init_py, (
-                    f"entry_point module '{expected_module}' not found in __init__.py "
-                    f"for {cat.value}/{robot.value}"
-                )
-                assert expected_module.isidentifier(), (
-                    f"Module name '{expected_module}' is not a valid Python identifier"
-                )
+        spec = TaskSpec(
+            category=cat, robot=robot,
+            description="test", objectives=[], constraints=[],
+        )
+        task_name = _make_task_name(spec)
+        task_id = _make_task_id(spec)
+        train_cfg = CATEGORY_TRAIN_CONFIG.get(cat.value)
+        init_py = _generate_init_py(task_name, task_id, "TestEnvCfg", train_cfg)
+        expected_module = f"{task_name}_env_cfg"
+        assert expected_module in init_py, (
+            f"entry_point module '{expected_module}' not found in __init__.py "
+            f"for {cat.value}/{robot.value}"
+        )
+        assert expected_module.isidentifier(), (
+            f"Module name '{expected_module}' is not a valid Python identifier"
+        )
 
 
 class TestGenerateTrainPy:
@@ -373,6 +386,27 @@ class TestPostProcessEnvCfg:
         assert "from isaaclab_assets.robots.cartpole import CARTPOLE_CFG" in result
         assert any("CARTPOLE_CFG" in f for f in fixes)
 
+    def test_import_inside_replaced_robot_span(self):
+        code = (
+            "from isaaclab.envs import ManagerBasedRLEnvCfg\n"
+            "\n"
+            "class MySceneCfg:\n"
+            "    robot = ArticulationCfg(\n"
+            '        prim_path="{ENV_REGEX_NS}/Robot",\n'
+            '        spawn="""\n'
+            "from isaaclab.sim import spawners\n"
+            '""",\n'
+            "    )\n"
+        )
+        result, fixes = post_process_env_cfg(code, "classic_cartpole")
+        ast.parse(result)
+        assert result.index("CARTPOLE_CFG  #") < result.index("class MySceneCfg")
+        assert "spawners" not in result
+
+    def test_overlapping_edits_are_rejected(self):
+        with pytest.raises(ValueError, match="Overlapping"):
+            generator._apply_edits("abcdef", [(1, 4, "X"), (2, 2, "Y")])
+
     def test_injects_franka_import(self):
         code = (
             "from isaaclab.envs import ManagerBasedRLEnvCfg\n"
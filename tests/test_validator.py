@@ -1,13 +1,18 @@
 """Tests for the config validator."""
 
+import os
+
 import pytest
 
+from robospec.pipeline import validator
 from robospec.pipeline.validator import (
     validate_config,
     ValidationResult,
     load_api_whitelist,
     check_api_symbols,
     auto_correct_code,
+    correct_and_validate,
+    parse_env_cfg,
 )
 
 
@@ -190,6 +195,20 @@ class TestValidator:
         assert len(result.warnings) > 0
         assert any("50.0" in w for w in result.warnings)
 
+    def test_non_config_text_fails_fast(self):
+        result = validate_config("Sure! Here is the config you asked for.")
+        assert not result.is_valid
+        assert result.errors == [
+            "No class definitions found: expected an env config with EnvCfg and RewardsCfg classes"
+        ]
+
+    def test_repeat_calls_return_independent_copies(self):
+        first = validate_config(MISSING_ENV_CFG_CODE)
+        first.errors.append("mutated")
+        second = validate_config(MISSING_ENV_CFG_CODE)
+        assert "mutated" not in second.errors
+        assert second.is_valid is False
+
 
 class TestApiWhitelist:
     def test_whitelist_loads_nonempty(self):
@@ -244,6 +263,22 @@ class TestApiWhitelist:
         assert "Did you mean" in errors[0]
         assert "action_rate_l2" in errors[0]
 
+    def test_reloads_when_reference_file_changes(self, tmp_path, monkeypatch):
+        api_dir = tmp_path / "api_reference"
+        api_dir.mkdir()
+        ref = api_dir / "mdp_rewards.md"
+        ref.write_text("### mdp.first_reward\n")
+        os.utime(ref, ns=(1_000_000_000, 1_000_000_000))
+        monkeypatch.setattr(validator, "KNOWLEDGE_DIR", tmp_path)
+
+        assert "first_reward" in load_api_whitelist()
+
+        ref.write_text("### mdp.second_reward\n")
+        os.utime(ref, ns=(2_000_000_000, 2_000_000_000))
+        whitelist = load_api_whitelist()
+        assert "second_reward" in whitelist
+        assert "first_reward" not in whitelist
+
 
 class TestAutoCorrect:
     def test_corrects_joint_pos_l2(self):
@@ -287,6 +322,31 @@ class TestAutoCorrect:
         assert errors == [], f"Post-correction errors: {errors}"
 
 
+class TestCorrectAndValidate:
+    def test_corrects_then_validates(self):
+        code = VALID_CODE.replace("mdp.is_alive", "mdp.joint_pos_l2")
+        corrected, corrections, result = correct_and_validate(code)
+        assert "mdp.joint_pos_target_l2" in corrected
+        assert corrections == ["mdp.joint_pos_l2 -> mdp.joint_pos_target_l2"]
+        assert result.is_valid is True
+
+    def test_matches_separate_calls(self):
+        corrected, corrections, result = correct_and_validate(FAKE_MDP_CODE)
+        expected_code, expected_corrections = auto_correct_code(FAKE_MDP_CODE)
+        assert corrected == expected_code
+        assert corrections == expected_corrections
+        assert result == validate_config(expected_code)
+
+
+class TestParseEnvCfg:
+    def test_reuses_tree_for_same_source(self):
+        assert parse_env_cfg(VALID_CODE) is parse_env_cfg(VALID_CODE)
+
+    def test_raises_on_syntax_error(self):
+        with pytest.raises(SyntaxError):
+            parse_env_cfg(SYNTAX_ERROR_CODE)
+
+
 class TestCheckApiSymbols:
     def test_empty_code(self):
         errors = check_api_symbols("x = 1", {"is_alive"})
@@ -312,6 +372,19 @@ class TestCheckApiSymbols:
         errors = check_api_symbols("class Broken(", {"is_alive"})
         assert errors == []
 
+    def test_suggestion_when_typo_changes_prefix(self):
+        errors = check_api_symbols("x = mdp.ss_alive", {"is_alive", "joint_pos"})
+        assert "Did you mean: mdp.is_alive?" in errors[0]
+
+    def test_suggestions_are_reused_across_calls(self):
+        validator.clear_caches()
+        code = "x = mdp.is_aliv"
+        first = check_api_symbols(code, {"is_alive"})
+        second = check_api_symbols(code, {"is_alive"})
+        assert first == second
+        assert "Did you mean: mdp.is_alive?" in first[0]
+        assert validator._suggest.cache_info().hits == 1
+
 
 # Code with literal ISAACLAB_NUCLEUS_DIR string (should fail)
 INLINE_ROBOT_CODE = '''